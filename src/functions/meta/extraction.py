@@ -1,23 +1,176 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 import json
 from datetime import datetime
 import time
+import threading
 import re
+import random
+import asyncio
+import concurrent.futures
+import httpx
+
+# orjson (parser JSON en C) es opcional: si no está instalado se usa el stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = ["InstagramMetaClient", "AsyncInstagramMetaClient", "TokenBucket", "collect_media_insights"]
+
+
+class TokenBucket:
+    """
+    Limitador de tasa local (token bucket): espacia las llamadas salientes para
+    no superar la cuota de Meta (~200 llamadas/usuario/hora), evitando entrar
+    en el ciclo de penalización por 429 que cuesta mucho más que la espera.
+    """
+
+    def __init__(self, capacity, refill_rate):
+        self.capacity = capacity
+        self.refill_rate = refill_rate  # tokens por segundo
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self._alock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_rate)
+        self.updated_at = now
+
+    def acquire(self, n=1):
+        """Espera (bloqueante) hasta disponer de n tokens y los consume."""
+        self._refill()
+        if self.tokens < n:
+            time.sleep((n - self.tokens) / self.refill_rate)
+            self._refill()
+        self.tokens -= n
+
+    async def acquire_async(self, n=1):
+        """Versión asíncrona: las tareas concurrentes se serializan por el lock."""
+        async with self._alock:
+            self._refill()
+            if self.tokens < n:
+                await asyncio.sleep((n - self.tokens) / self.refill_rate)
+                self._refill()
+            self.tokens -= n
+
 
 class InstagramMetaClient:
-    def __init__(self, access_token, instagram_account_id):
+
+    # Estados que ameritan reintento con backoff (throttling y errores transitorios)
+    RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+    # Máximo de sub-peticiones por llamada al endpoint batch del Graph API
+    BATCH_SIZE = 50
+
+    # Campos y métricas por endpoint, congelados a nivel de clase para no
+    # reconstruir los mismos strings en cada llamada
+    PROFILE_FIELDS = "id,ig_id,name,username,biography,followers_count,follows_count,media_count,profile_picture_url,website"
+    PROFILE_METRICS = "impressions,reach,profile_views,follower_count,email_contacts,get_directions_clicks,text_message_clicks,website_clicks"
+    AUDIENCE_METRICS = "audience_city,audience_country,audience_gender_age,audience_locale"
+    MEDIA_FIELDS = "id,caption,comments_count,is_comment_enabled,is_shared_to_feed,like_count,media_product_type,media_type,media_url,permalink,shortcode,thumbnail_url,timestamp,username"
+    COMMENT_FIELDS = "id,text,timestamp,username,like_count,from,parent_id"
+    MENTION_FIELDS = "id,caption,media_type,media_url,permalink,timestamp,username"
+    STORY_FIELDS = "id,caption,media_product_type,media_type,media_url,permalink,timestamp"
+    STORY_METRICS = "impressions,reach,replies,saved,shares,navigation"
+    REELS_METRICS = "clips_replays_count,comments,likes,plays,reach,saved,shares,total_interactions"
+    VIDEO_METRICS = "video_views,reach,saved,total_interactions"
+    IMAGE_METRICS = "impressions,reach,saved,engagement"
+
+    # Métricas según (media_product_type, media_type); IMAGE_METRICS es el default
+    _METRICS_BY_TYPE = {
+        ("REELS", None): REELS_METRICS,
+        ("CLIPS", None): REELS_METRICS,
+        (None, "VIDEO"): VIDEO_METRICS,
+    }
+
+    # Columnas del log de extracción (almacenado en formato columnar)
+    LOG_COLUMNS = (
+        "endpoint_called", "parameters_used", "raw_payload", "status_code",
+        "extraction_timestamp", "extraction_date", "payload_page", "retry_attempt"
+    )
+
+    def __init__(self, access_token, instagram_account_id, debug=True, calls_per_hour=200):
         self.access_token = access_token
         self.ig_id = instagram_account_id
         self.version = "v21.0"
         self.base_url = f"https://graph.facebook.com/{self.version}"
-        self.logs = []
+        # Con debug=True se registra el payload completo (lo necesita la capa bronze);
+        # con debug=False solo se guarda un resumen (tamaño y si hay página siguiente).
+        self.debug = debug
+        # Log columnar (una lista por columna): evita materializar un dict por
+        # petición y deja las columnas listas para construir el DataFrame sin
+        # re-inferencia de tipos fila a fila.
+        self.logs = {col: [] for col in self.LOG_COLUMNS}
+        # El prefetch de paginación loguea desde su hilo mientras el consumidor
+        # puede estar logueando desde el principal: el lock mantiene las ocho
+        # columnas alineadas fila a fila.
+        self._log_lock = threading.Lock()
+        # Caché en memoria para endpoints idempotentes: {clave: (monotonic, respuesta)}
+        self._cache = {}
+        # Último estado de cuota reportado por Meta en los headers de uso
+        self._quota_state = {}
+        # Limitador local: calls_per_hour debe corresponder al tier de la app
+        self._bucket = TokenBucket(capacity=calls_per_hour, refill_rate=calls_per_hour / 3600)
+        # Sesión compartida: reutiliza la conexión keep-alive hacia graph.facebook.com
+        # y evita pagar el handshake TCP+TLS en cada petición.
+        # Los reintentos por estado HTTP se manejan en _request (para respetar
+        # Retry-After y quedar registrados); el adapter solo reintenta fallos de conexión.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            max_retries=Retry(total=3, backoff_factor=0.5)
+        )
+        self.session.mount("https://", adapter)
+        # Un solo worker: mantiene una página de paginación en vuelo por adelantado
+        self._prefetch_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+    def close(self):
+        """Cierra la sesión HTTP subyacente y el pool de prefetch."""
+        self._prefetch_pool.shutdown(wait=False)
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _scrub(self, text):
         """Elimina tokens de acceso de cualquier string."""
         if not text or not isinstance(text, str): return text
+        # Meta casi nunca devuelve el token en el cuerpo: el chequeo 'in'
+        # (memmem a nivel C) corta en el caso común sin la copia de replace()
+        if self.access_token not in text:
+            return text
         return text.replace(self.access_token, "REDACTED_TOKEN")
 
+    @staticmethod
+    def _parse_json(content):
+        """Parsea el cuerpo de la respuesta con orjson si está disponible (2-5x más rápido)."""
+        if not content:
+            return {}
+        if orjson is not None:
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(content)
+
+    @staticmethod
+    def _dump_json(obj):
+        """Serializa a JSON con orjson si está disponible."""
+        if orjson is not None:
+            try:
+                return orjson.dumps(obj).decode()
+            except TypeError:
+                pass
+        return json.dumps(obj, default=str)
+
     def _clean_endpoint(self, url):
         """
         Limpia la URL para dejar solo el ID y el recurso.
@@ -29,105 +182,304 @@ class InstagramMetaClient:
         clean_path = clean_path.split('?')[0]
         return clean_path
 
-    def _log_step(self, raw_url, params, response, page_num):
+    def _log_step(self, raw_url, params, response, page_num, retry_attempt=0):
         """Registra cada interacción con limpieza de endpoint."""
         try:
-            res_json = response.json()
-            payload = self._scrub(json.dumps(res_json))
+            payload = self._parse_json(response.content)
         except:
-            payload = self._scrub(response.text)
+            payload = response.text
 
+        self._log_entry(raw_url, params, payload, response.status_code, page_num, retry_attempt)
+
+    def _log_entry(self, raw_url, params, payload, status_code, page_num, retry_attempt=0):
+        """
+        Registra una interacción ya resuelta (común a los caminos sync y async).
+        El payload se guarda tal cual (dict o string): la serialización a JSON
+        y el scrubbing se difieren a export_logs, fuera del camino caliente.
+        """
         # Limpiar el nombre del endpoint para el log
         endpoint_name = self._clean_endpoint(raw_url)
 
         # Limpiar parámetros para el log
-        safe_params = params.copy() if isinstance(params, dict) else {"url": self._scrub(str(params))}
-        if 'access_token' in safe_params: safe_params.pop('access_token')
-
-        self.logs.append({
-            "endpoint_called": endpoint_name,
-            "parameters_used": json.dumps(safe_params),
-            "raw_payload": payload,
-            "status_code": response.status_code,
-            "extraction_timestamp": datetime.now(),
-            "extraction_date": datetime.now().date(),
-            "payload_page": page_num
-        })
-
-    def _request(self, path, params=None, page_num=0):
-        """Manejador central de peticiones."""
+        if isinstance(params, dict):
+            safe_params = {k: v for k, v in params.items() if k != 'access_token'}
+        else:
+            safe_params = {"url": self._scrub(str(params))}
+
+        if not self.debug:
+            # Resumen liviano en lugar del payload completo
+            if isinstance(payload, dict):
+                paging = payload.get("paging") or {}
+                payload = {"payload_size": len(payload), "has_next_page": "next" in paging}
+            else:
+                payload = {"payload_size": len(payload) if payload else 0, "has_next_page": False}
+
+        now = datetime.now()
+        with self._log_lock:
+            logs = self.logs
+            logs["endpoint_called"].append(endpoint_name)
+            logs["parameters_used"].append(safe_params)
+            logs["raw_payload"].append(payload)
+            logs["status_code"].append(status_code)
+            logs["extraction_timestamp"].append(now)
+            logs["extraction_date"].append(now.date())
+            logs["payload_page"].append(page_num)
+            logs["retry_attempt"].append(retry_attempt)
+
+    def _update_quota_state(self, response):
+        """Lee los headers de uso de cuota de Meta y frena antes de agotarla."""
+        usage = response.headers.get("X-App-Usage") or response.headers.get("X-Business-Use-Case-Usage")
+        if not usage:
+            return
+        try:
+            self._quota_state = json.loads(usage)
+        except ValueError:
+            return
+        if isinstance(self._quota_state, dict):
+            call_count = self._quota_state.get("call_count", 0)
+            if isinstance(call_count, (int, float)) and call_count > 90:
+                # Más del 90% de la cuota consumida: esperar antes de seguir llamando
+                time.sleep(min(60, call_count - 90))
+
+    @staticmethod
+    def _retry_delay(retry_after, attempt):
+        """
+        Segundos a esperar antes de reintentar: el valor de Retry-After si es
+        numérico; si viene en la forma HTTP-date del RFC 7231 (o no viene),
+        backoff exponencial con jitter acotado a 60 s.
+        """
+        if retry_after:
+            try:
+                return int(retry_after)
+            except ValueError:
+                pass
+        return min(60, (2 ** attempt) + random.random())
+
+    def _request(self, path, params=None, page_num=0, max_retries=5):
+        """Manejador central de peticiones con backoff ante throttling (429/5xx)."""
         # Si path ya es una URL completa (por paginación), la usamos. Si no, construimos.
         url = path if path.startswith("http") else f"{self.base_url}/{path}"
-        
+
         if "access_token" not in url:
             if params is None: params = {}
             params['access_token'] = self.access_token
 
         try:
-            response = requests.get(url, params=params)
-            # Pasamos la URL original (con o sin base) para que _log_step la limpie
-            self._log_step(url, params, response, page_num)
-            return response.json()
+            for attempt in range(max_retries):
+                self._bucket.acquire()
+                response = self.session.get(url, params=params, timeout=(3.05, 30))
+                # Pasamos la URL original (con o sin base) para que _log_step la limpie
+                self._log_step(url, params, response, page_num, retry_attempt=attempt)
+                self._update_quota_state(response)
+
+                if response.status_code not in self.RETRY_STATUS_CODES or attempt == max_retries - 1:
+                    return self._parse_json(response.content)
+
+                # Respetar Retry-After si Meta lo indica; si no, backoff exponencial con jitter
+                delay = self._retry_delay(response.headers.get("Retry-After"), attempt)
+                time.sleep(delay)
         except Exception as e:
             return {"error": str(e)}
 
-    def _get_paginated_data(self, path, params):
-        """Itera sobre todas las páginas de un endpoint."""
-        all_data = []
+    def _cached_request(self, path, params=None, ttl=0):
+        """
+        Devuelve la respuesta cacheada para endpoints de datos lentos en cambiar,
+        evitando el viaje HTTP (y el consumo de cuota) si sigue vigente.
+        Con ttl=0 se comporta igual que _request.
+        """
+        if not ttl:
+            return self._request(path, params)
+
+        key = (path, tuple(sorted(params.items())) if params else ())
+        hit = self._cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < ttl:
+            return hit[1]
+
+        data = self._request(path, params)
+        # No cachear respuestas con error para no ocultar fallos transitorios
+        if isinstance(data, dict) and "error" not in data:
+            self._cache[key] = (time.monotonic(), data)
+        return data
+
+    def _iter_paginated(self, path, params):
+        """
+        Genera las páginas de un endpoint una a una, sin materializar la lista
+        completa: memoria O(1 página) y el consumidor puede procesar cada página
+        mientras se descarga la siguiente.
+        """
         page_num = 0
         response = self._request(path, params, page_num)
-        all_data.append(response)
 
-        while response and "paging" in response and "next" in response["paging"]:
-            page_num += 1
-            # El campo 'next' es una URL completa
-            response = self._request(response["paging"]["next"], page_num=page_num)
-            all_data.append(response)
-        return all_data
+        while True:
+            future = None
+            if response and "paging" in response and "next" in response["paging"]:
+                page_num += 1
+                # Prefetch: la página siguiente ('next' es una URL completa) se
+                # descarga en segundo plano mientras el consumidor procesa la actual
+                future = self._prefetch_pool.submit(
+                    self._request, response["paging"]["next"], page_num=page_num
+                )
+            yield response
+            if future is None:
+                return
+            response = future.result()
+
+    def _get_paginated_data(self, path, params):
+        """Itera sobre todas las páginas de un endpoint (materializa la lista)."""
+        return list(self._iter_paginated(path, params))
 
     # --- MÉTODOS DE EXTRACCIÓN ---
 
-    def get_profile_stats(self):
-        fields = "id,ig_id,name,username,biography,followers_count,follows_count,media_count,profile_picture_url,website"
-        return self._request(f"{self.ig_id}", {"fields": fields})
+    def get_profile_stats(self, ttl=300):
+        return self._cached_request(f"{self.ig_id}", {"fields": self.PROFILE_FIELDS}, ttl=ttl)
 
-    def get_profile_insights(self):
-        metrics = "impressions,reach,profile_views,follower_count,email_contacts,get_directions_clicks,text_message_clicks,website_clicks"
-        return self._request(f"{self.ig_id}/insights", {"metric": metrics, "period": "day"})
+    def get_profile_insights(self, ttl=300):
+        return self._cached_request(f"{self.ig_id}/insights", {"metric": self.PROFILE_METRICS, "period": "day"}, ttl=ttl)
 
-    def get_audience_insights(self):
-        metrics = "audience_city,audience_country,audience_gender_age,audience_locale"
-        return self._request(f"{self.ig_id}/insights", {"metric": metrics, "period": "lifetime"})
+    def get_audience_insights(self, ttl=3600):
+        return self._cached_request(f"{self.ig_id}/insights", {"metric": self.AUDIENCE_METRICS, "period": "lifetime"}, ttl=ttl)
 
     def get_media_data(self):
-        fields = "id,caption,comments_count,is_comment_enabled,is_shared_to_feed,like_count,media_product_type,media_type,media_url,permalink,shortcode,thumbnail_url,timestamp,username"
-        return self._get_paginated_data(f"{self.ig_id}/media", {"fields": fields})
+        return self._get_paginated_data(f"{self.ig_id}/media", {"fields": self.MEDIA_FIELDS})
 
-    def get_media_insights(self, item):
-        media_id = item.get('id')
+    def iter_media_data(self):
+        """Variante streaming de get_media_data: genera página a página."""
+        return self._iter_paginated(f"{self.ig_id}/media", {"fields": self.MEDIA_FIELDS})
+
+    def get_media_posts(self):
+        """
+        Devuelve la lista plana de publicaciones recorriendo toda la paginación
+        del servidor (un 'limit' grande no sirve: Meta lo capea en ~100 y exige
+        seguir paging.next). No imprime nada: el caller decide qué hacer.
+        """
+        posts = []
+        for page in self.iter_media_data():
+            if isinstance(page, dict) and "data" in page:
+                posts.extend(page["data"])
+        return posts
+
+    def get_media_bundle(self, media_limit=50, comments_limit=50):
+        """
+        Colapsa el patrón N+1 (media -> insights por post -> comments por post)
+        en una sola llamada usando la expansión anidada de campos del Graph API.
+
+        Devuelve un dict con las mismas formas que los métodos individuales:
+            {
+                "media": [items como los de get_media_data],
+                "insights": {media_id: respuesta tipo get_media_insights},
+                "comments": {media_id: páginas tipo get_comments}
+            }
+        """
+        response = self._request(f"{self.ig_id}", {"fields": self._bundle_fields(media_limit, comments_limit)})
+
+        media_items, insights_by_id, comments_by_id = self._split_bundle(response)
+
+        # Fallback por id para los tipos donde el insight anidado no está soportado
+        # (p.ej. REELS/CLIPS, que usan su propio set de métricas)
+        for item in media_items:
+            if insights_by_id.get(item.get("id")) is None:
+                insights_by_id[item.get("id")] = self.get_media_insights(item)
+
+        return {"media": media_items, "insights": insights_by_id, "comments": comments_by_id}
+
+    @staticmethod
+    def _bundle_fields(media_limit, comments_limit):
+        """Arma la expansión anidada de campos que usa get_media_bundle."""
+        return (
+            f"media.limit({media_limit})"
+            "{id,caption,comments_count,is_comment_enabled,is_shared_to_feed,like_count,"
+            "media_product_type,media_type,media_url,permalink,shortcode,thumbnail_url,timestamp,username,"
+            "insights.metric(reach,saved,total_interactions),"
+            f"comments.limit({comments_limit}){{id,text,timestamp,username,like_count}}}}"
+        )
+
+    @staticmethod
+    def _split_bundle(response):
+        """Separa la respuesta anidada del bundle en (media, insights, comments)."""
+        media_items = []
+        insights_by_id = {}
+        comments_by_id = {}
+        media_data = response.get("media", {}) if isinstance(response, dict) else {}
+        for item in media_data.get("data", []):
+            media_id = item.get("id")
+            insights_by_id[media_id] = item.pop("insights", None)
+            # get_comments devuelve una lista de páginas; envolvemos para mantener la forma
+            comments = item.pop("comments", None)
+            comments_by_id[media_id] = [comments] if comments is not None else None
+            media_items.append(item)
+        return media_items, insights_by_id, comments_by_id
+
+    def _metrics_for(self, item):
+        """Resuelve el set de métricas según el tipo de publicación."""
         media_product_type = item.get('media_product_type', 'FEED')
         media_type = item.get('media_type')
-        
-        if media_product_type in ["REELS", "CLIPS"]:
-            metrics = "clips_replays_count,comments,likes,plays,reach,saved,shares,total_interactions"
-        elif media_type == "VIDEO":
-            metrics = "video_views,reach,saved,total_interactions"
-        else:
-            metrics = "impressions,reach,saved,engagement"
-            
-        return self._request(f"{media_id}/insights", {"metric": metrics})
+        return (self._METRICS_BY_TYPE.get((media_product_type, None))
+                or self._METRICS_BY_TYPE.get((None, media_type), self.IMAGE_METRICS))
+
+    def get_media_insights(self, item):
+        media_id = item.get('id')
+        return self._request(f"{media_id}/insights", {"metric": self._metrics_for(item)})
+
+    def get_media_insights_batch(self, media_items):
+        """
+        Agrupa las consultas de insights en lotes de hasta BATCH_SIZE sub-peticiones
+        por llamada usando el endpoint batch del Graph API (POST /?batch=...):
+        un solo viaje HTTP devuelve las respuestas de todo el lote.
+
+        Devuelve {media_id: respuesta con la misma forma que get_media_insights}.
+        """
+        results = {}
+        for start in range(0, len(media_items), self.BATCH_SIZE):
+            chunk = media_items[start:start + self.BATCH_SIZE]
+            batch = self._insights_batch_payload(chunk)
+            try:
+                # El POST batch también consume cuota del Graph API: pasa por
+                # el limitador local igual que las peticiones individuales
+                self._bucket.acquire()
+                response = self.session.post(
+                    self.base_url,
+                    data={"access_token": self.access_token, "batch": json.dumps(batch)},
+                    timeout=(3.05, 60)
+                )
+                self._log_step(self.base_url, {"batch_size": len(batch)}, response,
+                               page_num=start // self.BATCH_SIZE)
+                entries = self._parse_json(response.content)
+            except Exception as e:
+                entries = {"error": str(e)}
+
+            if not isinstance(entries, list):
+                # El batch completo falló: caer al camino por id
+                for m in chunk:
+                    results[m.get('id')] = self.get_media_insights(m)
+                continue
+
+            # Cada entrada trae su propio 'code' y el 'body' como string JSON
+            for m, entry in zip(chunk, entries):
+                if isinstance(entry, dict) and entry.get("body"):
+                    results[m.get('id')] = self._parse_json(entry["body"])
+                else:
+                    results[m.get('id')] = self.get_media_insights(m)
+        return results
+
+    def _insights_batch_payload(self, chunk):
+        """Arma las sub-peticiones de un lote para el endpoint batch."""
+        return [
+            {"method": "GET", "relative_url": f"{m.get('id')}/insights?metric={self._metrics_for(m)}"}
+            for m in chunk
+        ]
 
     def get_comments(self, media_id):
-        fields = "id,text,timestamp,username,like_count,from,parent_id"
-        return self._get_paginated_data(f"{media_id}/comments", {"fields": fields})
+        return self._get_paginated_data(f"{media_id}/comments", {"fields": self.COMMENT_FIELDS})
+
+    def iter_comments(self, media_id):
+        """Variante streaming de get_comments: genera página a página."""
+        return self._iter_paginated(f"{media_id}/comments", {"fields": self.COMMENT_FIELDS})
 
     def get_mentions(self):
-        fields = "id,caption,media_type,media_url,permalink,timestamp,username"
-        return self._get_paginated_data(f"{self.ig_id}/tags", {"fields": fields})
+        return self._get_paginated_data(f"{self.ig_id}/tags", {"fields": self.MENTION_FIELDS})
 
     def get_active_stories(self):
-        fields = "id,caption,media_product_type,media_type,media_url,permalink,timestamp"
-        stories_pages = self._get_paginated_data(f"{self.ig_id}/stories", {"fields": fields})
+        stories_pages = self._get_paginated_data(f"{self.ig_id}/stories", {"fields": self.STORY_FIELDS})
         # for page in stories_pages:
         #     if "data" in page:
         #         for story in page["data"]:
@@ -136,4 +488,190 @@ class InstagramMetaClient:
         return stories_pages
 
     def export_logs(self):
-        return pd.DataFrame(self.logs)
+        # Las columnas ya vienen alineadas: pandas las consume sin pasar por
+        # la re-inferencia fila a fila de una lista de dicts.
+        df = pd.DataFrame(self.logs)
+        if not df.empty:
+            # Serialización diferida: el camino caliente guarda dicts sin volcar a JSON
+            df["parameters_used"] = df["parameters_used"].map(self._dump_json)
+            df["raw_payload"] = df["raw_payload"].map(
+                lambda p: self._scrub(p if isinstance(p, str) else self._dump_json(p))
+            )
+            df = df.astype({
+                "status_code": "int16",
+                "payload_page": "int32",
+                "retry_attempt": "int16",
+                "endpoint_called": "category"
+            })
+        return df
+
+    # Alias por compatibilidad con callers que usan el nombre viejo
+    get_logs_dataframe = export_logs
+
+
+class AsyncInstagramMetaClient(InstagramMetaClient):
+    """
+    Variante asíncrona de InstagramMetaClient basada en httpx con HTTP/2.
+
+    Sobrescribe '_request' y '_get_paginated_data' como corutinas, por lo que
+    los métodos de extracción heredados (get_media_insights, get_comments, etc.)
+    devuelven awaitables. HTTP/2 multiplexa las peticiones concurrentes sobre
+    una sola conexión TLS, y la concurrencia se acota con un semáforo para
+    respetar los límites de tasa de Meta. El camino sync con requests.Session
+    (InstagramMetaClient) queda como alternativa.
+
+    Uso:
+        async with AsyncInstagramMetaClient(token, ig_id) as client:
+            media_pages = await client.get_media_data()
+            insights = await client.collect_all_media_insights(media_items)
+    """
+
+    def __init__(self, access_token, instagram_account_id, max_concurrency=10):
+        super().__init__(access_token, instagram_account_id)
+        self.max_concurrency = max_concurrency
+        self._aclient = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        self._aclient = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            timeout=httpx.Timeout(10.0, connect=5.0)
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self._aclient.aclose()
+
+    async def _request(self, path, params=None, page_num=0, max_retries=5):
+        """Manejador central de peticiones (asíncrono) con backoff ante throttling (429/5xx)."""
+        url = path if path.startswith("http") else f"{self.base_url}/{path}"
+
+        if "access_token" not in url:
+            if params is None: params = {}
+            params['access_token'] = self.access_token
+
+        try:
+            for attempt in range(max_retries):
+                async with self._semaphore:
+                    await self._bucket.acquire_async()
+                    response = await self._aclient.get(url, params=params)
+                try:
+                    data = self._parse_json(response.content)
+                except ValueError:
+                    data = {"error": response.text}
+                self._log_entry(url, params, data, response.status_code, page_num, retry_attempt=attempt)
+
+                if response.status_code not in self.RETRY_STATUS_CODES or attempt == max_retries - 1:
+                    return data
+
+                # Igual que en el camino sync: respetar Retry-After si Meta lo
+                # indica; si no, backoff exponencial con jitter. El fan-out
+                # concurrente es justo donde más aparece el throttling.
+                delay = self._retry_delay(response.headers.get("Retry-After"), attempt)
+                await asyncio.sleep(delay)
+        except Exception as e:
+            return {"error": str(e)}
+
+    async def _cached_request(self, path, params=None, ttl=0):
+        """La caché sync no aplica a corutinas; se delega directo a _request."""
+        return await self._request(path, params)
+
+    def _iter_paginated(self, path, params):
+        """
+        El streaming página a página (con prefetch en hilo) es exclusivo del
+        camino sync: acá _request es una corutina y el generador no puede
+        esperarla. Usar _get_paginated_data o get_media_posts, que son
+        corutinas. Cubre también iter_media_data e iter_comments heredados.
+        """
+        raise NotImplementedError(
+            "el cliente asíncrono no soporta iteración streaming; usar _get_paginated_data"
+        )
+
+    async def _get_paginated_data(self, path, params):
+        """Itera sobre todas las páginas de un endpoint (asíncrono)."""
+        all_data = []
+        page_num = 0
+        response = await self._request(path, params, page_num)
+        all_data.append(response)
+
+        while response and "paging" in response and "next" in response["paging"]:
+            page_num += 1
+            response = await self._request(response["paging"]["next"], page_num=page_num)
+            all_data.append(response)
+        return all_data
+
+    async def get_media_posts(self):
+        """Versión asíncrona: aplana las páginas de media en una lista de publicaciones."""
+        posts = []
+        for page in await self.get_media_data():
+            if isinstance(page, dict) and "data" in page:
+                posts.extend(page["data"])
+        return posts
+
+    async def get_media_bundle(self, media_limit=50, comments_limit=50):
+        """Versión asíncrona de get_media_bundle (misma expansión anidada de campos)."""
+        response = await self._request(f"{self.ig_id}", {"fields": self._bundle_fields(media_limit, comments_limit)})
+
+        media_items, insights_by_id, comments_by_id = self._split_bundle(response)
+
+        for item in media_items:
+            if insights_by_id.get(item.get("id")) is None:
+                insights_by_id[item.get("id")] = await self.get_media_insights(item)
+
+        return {"media": media_items, "insights": insights_by_id, "comments": comments_by_id}
+
+    async def get_media_insights_batch(self, media_items):
+        """Versión asíncrona del endpoint batch: el POST va por el cliente httpx."""
+        results = {}
+        for start in range(0, len(media_items), self.BATCH_SIZE):
+            chunk = media_items[start:start + self.BATCH_SIZE]
+            batch = self._insights_batch_payload(chunk)
+            try:
+                async with self._semaphore:
+                    await self._bucket.acquire_async()
+                    response = await self._aclient.post(
+                        self.base_url,
+                        data={"access_token": self.access_token, "batch": json.dumps(batch)}
+                    )
+                entries = self._parse_json(response.content)
+                self._log_entry(self.base_url, {"batch_size": len(batch)}, entries,
+                                response.status_code, page_num=start // self.BATCH_SIZE)
+            except Exception as e:
+                entries = {"error": str(e)}
+
+            if not isinstance(entries, list):
+                # El batch completo falló: caer al camino por id
+                for m in chunk:
+                    results[m.get('id')] = await self.get_media_insights(m)
+                continue
+
+            for m, entry in zip(chunk, entries):
+                if isinstance(entry, dict) and entry.get("body"):
+                    results[m.get('id')] = self._parse_json(entry["body"])
+                else:
+                    results[m.get('id')] = await self.get_media_insights(m)
+        return results
+
+    async def collect_all_media_insights(self, media_items):
+        """Lanza en paralelo get_media_insights para cada publicación."""
+        return await asyncio.gather(*[self.get_media_insights(item) for item in media_items])
+
+    async def collect_all_comments(self, media_items):
+        """Lanza en paralelo get_comments para cada publicación."""
+        return await asyncio.gather(*[self.get_comments(item.get('id')) for item in media_items])
+
+    async def collect_all_story_insights(self, stories):
+        """Lanza en paralelo la consulta de insights de cada historia activa."""
+        return await asyncio.gather(
+            *[self._request(f"{story['id']}/insights", {"metric": self.STORY_METRICS}) for story in stories]
+        )
+
+
+def collect_media_insights(access_token, instagram_account_id, media_items, max_concurrency=10):
+    """Wrapper síncrono: obtiene en paralelo los insights de una lista de publicaciones."""
+    async def _runner():
+        async with AsyncInstagramMetaClient(access_token, instagram_account_id, max_concurrency) as client:
+            return await client.collect_all_media_insights(media_items)
+    return asyncio.run(_runner())
@@ -1,9 +1,30 @@
 import requests
 import json
 import time
+import os
+import functools
 
-client_id = '2976654519207527' # Meta App > Configuración de la App > Básica > Identificador de la app
-client_secret = '5c6d2c23580207a0a3c5db2f93f82b68' # Meta App > Configuración de la App > Básica > Clave secreta de la app
+# URLs del Graph API precomputadas a nivel de módulo
+_GRAPH_ROOT = "https://graph.facebook.com"
+_DEBUG_TOKEN_URL = f"{_GRAPH_ROOT}/debug_token"
+_EXCHANGE_URL = f"{_GRAPH_ROOT}/v21.0/oauth/access_token"
+
+# Caché local de expiración del token: evita consultar /debug_token en cada corrida
+TOKEN_CACHE_PATH = "token_expiry_cache.json"
+TOKEN_CACHE_MAX_AGE = 86400  # re-verificar contra Meta como mucho una vez por día
+
+def get_app_credentials():
+    """
+    Lee el App ID y la App Secret desde variables de entorno, con fallback al
+    secret store de Databricks. No deben quedar hard-codeadas en el módulo.
+    (Meta App > Configuración de la App > Básica)
+    """
+    client_id = os.environ.get("META_APP_ID")
+    client_secret = os.environ.get("META_APP_SECRET")
+    if not client_id or not client_secret:
+        client_id = dbutils.secrets.get(scope="meta", key="app_id")
+        client_secret = dbutils.secrets.get(scope="meta", key="app_secret")
+    return client_id, client_secret
 
 def get_secret_token(scope="meta", key="access_token"):
     """
@@ -11,23 +32,58 @@ def get_secret_token(scope="meta", key="access_token"):
     """
     return dbutils.secrets.get(scope=scope, key=key)
 
+def load_token_cache(path=TOKEN_CACHE_PATH):
+    """
+    Lee la caché local {'expires_at': int, 'checked_at': int}.
+    Devuelve None si no existe o es inválida.
+    """
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_token_cache(expires_at, path=TOKEN_CACHE_PATH):
+    """
+    Guarda la expiración conocida del token junto con el momento de la consulta.
+    """
+    try:
+        with open(path, "w") as f:
+            json.dump({"expires_at": expires_at, "checked_at": int(time.time())}, f)
+    except OSError as e:
+        print(f"No se pudo guardar la caché del token: {e}")
+
+def get_days_left(secret_token, client_id, client_secret):
+    """
+    Días restantes de expiración del token. Usa la caché local si fue
+    verificada hace menos de TOKEN_CACHE_MAX_AGE; si no, consulta /debug_token.
+    Así la decisión de refresco es aritmética local en el camino común.
+    """
+    now = int(time.time())
+    cache = load_token_cache()
+    if cache and cache.get("expires_at") and now - cache.get("checked_at", 0) <= TOKEN_CACHE_MAX_AGE:
+        return (cache["expires_at"] - now) // 86400
+    return check_token_expiry(secret_token, client_id, client_secret)
+
+@functools.lru_cache(maxsize=4)
 def check_token_expiry(secret_token, client_id, client_secret):
     """
     Verifica cuánto tiempo de uso le queda a un access token de Meta.
-    Devuelve días restantes para la expiración.
+    Devuelve días restantes para la expiración. Memoizada en proceso para que
+    llamadas repetidas con el mismo token no repitan el viaje a /debug_token.
     """
-    debug_url = "https://graph.facebook.com/debug_token"
     app_token = f"{client_id}|{client_secret}"
     params = {
         'input_token': secret_token,
         'access_token': app_token
     }
     try:
-        response = requests.get(debug_url, params=params)
+        response = requests.get(_DEBUG_TOKEN_URL, params=params)
         data = response.json()
         if response.status_code == 200 and 'data' in data:
             expires_at = data['data'].get('expires_at')
             if expires_at:
+                save_token_cache(expires_at)
                 now = int(time.time())
                 seconds_left = expires_at - now
                 days_left = seconds_left // 86400
@@ -50,8 +106,6 @@ def get_long_lived_token(client_id, client_secret, secret_token):
     - Necesario: Haber almacenado un token como secret ni bien fue creado, verificar sus metadatos cada 7 días (o averiguar si se puede consultar expiración de un token), y cuando falte 8 días o menos, ejecutar esta función.
     - Debes: Almacenar este token como secret.
     """
-    url = "https://graph.facebook.com/v21.0/oauth/access_token"
-
     params = {
         'grant_type': 'fb_exchange_token',
         'client_id': client_id,
@@ -60,10 +114,14 @@ def get_long_lived_token(client_id, client_secret, secret_token):
     }
 
     try:
-        response = requests.get(url, params=params)
+        response = requests.get(_EXCHANGE_URL, params=params)
         data = response.json()
 
         if response.status_code == 200 and 'access_token' in data:
+            # Actualizar la caché local con la nueva expiración (token de ~60 días)
+            expires_in = data.get('expires_in')
+            if expires_in:
+                save_token_cache(int(time.time()) + int(expires_in))
             return data.get('access_token')
         else:
             print(f"❌ Error al canjear token: {data}")
@@ -81,20 +139,24 @@ def save_long_lived_token(access_token, scope="meta", key="access_token"):
 
 if __name__ == "__main__":
 
+    # 0. Credenciales de la app desde el entorno / secret store
+    client_id, client_secret = get_app_credentials()
+
     # 1. Obtenemos el Access Token del Secret AWS
     secret_token = ""
     # secret_token = get_secret_token(scope="meta", key="access_token")
 
-    # 2. Verificamos si el Token tiene 8 días o menos para expirar 
-    # if check_token_expiry(secret_token, client_id, client_secret) <= 8:
-    if check_token_expiry(secret_token, client_id, client_secret) <= 60:
+    # 2. Verificamos si el Token tiene 8 días o menos para expirar
+    # (usa la caché local y solo consulta /debug_token si está vencida o ausente)
+    days_left = get_days_left(secret_token, client_id, client_secret)
+    if days_left is not None and days_left <= 8:
 
         # 3. Si tiene 8 días o menos para expirar, generamos un nuevo Access Token
         access_token = get_long_lived_token(client_id, client_secret, secret_token)
         print(f"Nuevo Access Token: {access_token}")
 
         # 4. Guardamos el 'access_token' en el secret reemplazando el anterior
-        # save_long_lived_token(access_token, scope="meta", key="access_token") 
+        # save_long_lived_token(access_token, scope="meta", key="access_token")
 
     else:
         pass
\ No newline at end of file
@@ -7,10 +7,26 @@ Date: 2026-01-20
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Tuple
+from io import BytesIO
+import asyncio
+import functools
+import types
+from concurrent.futures import ThreadPoolExecutor
+import aiohttp
 import requests
-from lxml import html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree, html
+import csv
+import hashlib
 import json
+import re
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
 import time
 import pandas as pd
 from datetime import datetime
@@ -56,6 +72,42 @@ SCRAPER_CONFIG = {
 }
 
 
+# Shared parser instance: html.fromstring without an explicit parser builds a
+# fresh one on every call. Reusing one parser also lets lxml consume raw bytes
+# (skipping the Python-level UTF-8 decode) and stripping comments/PIs in the C
+# parser shrinks the DOM every downstream XPath has to traverse.
+_HTML_PARSER = html.HTMLParser(encoding='utf-8', recover=True, remove_comments=True, remove_pis=True)
+
+
+# Whitespace runs (spaces, tabs, newlines) collapsed in one C-level pass
+_WS = re.compile(r'\s+')
+
+
+def _simhash64(text: str) -> int:
+    """
+    64-bit SimHash over whitespace tokens. Near-identical texts (e.g. wire
+    copy republished with minor edits) produce hashes within a small Hamming
+    distance of each other, so duplicates can be detected without comparing
+    full bodies.
+    """
+    if not text:
+        return 0
+    weights = [0] * 64
+    for token in text.split():
+        h = int.from_bytes(hashlib.md5(token.encode('utf-8')).digest()[:8], 'big')
+        for bit in range(64):
+            weights[bit] += 1 if (h >> bit) & 1 else -1
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+
+def _xp_class(name: str) -> str:
+    """
+    XPath predicate matching a whole class token. Unlike contains(@class, ...),
+    this does not false-positive on substrings (e.g. "col" vs "col-lg-4").
+    """
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
 # ============================================================================
 # Base Abstract Class
 # ============================================================================
@@ -65,7 +117,18 @@ class BaseNewspaperScraper(ABC):
     Abstract base class for newspaper scrapers.
     Each concrete scraper must implement portal-specific extraction logic.
     """
-    
+
+    # Config resolved once at class definition: identical for every scraper,
+    # so no per-instance dict lookups, and the read-only headers proxy keeps
+    # a stray mutation from silently de-syncing live sessions
+    _HEADERS = types.MappingProxyType(SCRAPER_CONFIG["headers"])
+    _TIMEOUT = SCRAPER_CONFIG["timeout"]
+    _DELAY = SCRAPER_CONFIG["request_delay"]
+
+    # Slots drop the per-instance __dict__ and make attribute access an
+    # index lookup; also rejects accidental dynamic attributes
+    __slots__ = ('name', 'urls', 'session', '_seen_urls', '_parse_pool', '_ts_monot', '_ts_iso')
+
     def __init__(self, name: str, urls: List[str]):
         """
         Initialize the scraper.
@@ -76,10 +139,66 @@ class BaseNewspaperScraper(ABC):
         """
         self.name = name
         self.urls = urls
-        self.headers = SCRAPER_CONFIG["headers"]
-        self.timeout = SCRAPER_CONFIG["timeout"]
-        self.request_delay = SCRAPER_CONFIG["request_delay"]
-        
+
+        # Pooled session: keeps the TLS connection to each portal alive across
+        # article fetches instead of paying a full handshake per request
+        self.session = requests.Session()
+        self.session.headers.update(self._HEADERS)
+        # Transient listing/article failures retry transparently inside the
+        # pool (honouring Retry-After) instead of losing a whole portal page
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=("GET",),
+                respect_retry_after_header=True,
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # URLs already fetched (possibly shared across scrapers by the
+        # orchestrator) so syndicated articles are downloaded only once
+        self._seen_urls: set = set()
+
+        # lxml releases the GIL while parsing, so handing article HTML to a
+        # small thread pool overlaps parsing with the next network reads
+        self._parse_pool = ThreadPoolExecutor(max_workers=4)
+
+        # Per-second cache for scraped_at timestamps (see _now_iso)
+        self._ts_monot = float('-inf')
+        self._ts_iso = ""
+
+    def _now_iso(self) -> str:
+        """
+        ISO timestamp for scraped_at, refreshed at most once per second.
+        Article-level resolution doesn't need sub-second precision, so this
+        avoids a datetime construction + format call per article.
+        """
+        t = time.monotonic()
+        if t - self._ts_monot >= 1.0:
+            self._ts_iso = datetime.now().isoformat()
+            self._ts_monot = t
+        return self._ts_iso
+
+    def set_seen_urls(self, seen_urls: set) -> None:
+        """Share a seen-URL set (owned by the orchestrator) with this scraper."""
+        self._seen_urls = seen_urls
+
+    def close(self) -> None:
+        """Release the pooled HTTP connections and the parse thread pool."""
+        self.session.close()
+        self._parse_pool.shutdown(wait=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def get_tree(self, url: str) -> Optional[html.HtmlElement]:
         """
         Fetch and parse HTML from a URL.
@@ -88,19 +207,47 @@ class BaseNewspaperScraper(ABC):
             url: URL to fetch
             
         Returns:
-            Parsed HTML tree or None if error
+            Parsed HTML tree, or None for a non-200 response
+
+        Raises:
+            requests.RequestException: when retries inside the pooled
+                adapter are exhausted; transient errors no longer vanish
+                into a logged None
         """
-        try:
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
-            if response.status_code == 200:
-                # Explicitly decode content as UTF-8 to handle special characters
-                return html.fromstring(response.content.decode('utf-8'))
-            else:
-                logger.warning(f"HTTP {response.status_code} for {url}")
-        except Exception as e:
-            logger.error(f"Error loading {url}: {e}")
+        response = self.session.get(url, timeout=self._TIMEOUT)
+        if response.status_code == 200:
+            # The shared parser is configured for UTF-8 and parses bytes natively
+            return html.fromstring(response.content, parser=_HTML_PARSER)
+        logger.warning(f"HTTP {response.status_code} for {url}")
         return None
     
+    def _iter_links(self, content: bytes, absolute_only: bool = True) -> Iterator[Tuple[etree._Element, str]]:
+        """
+        Stream (<a> element, href) pairs from raw listing HTML via iterparse,
+        clearing consumed elements so memory stays bounded instead of holding
+        the full DOM. With absolute_only (the default) only http(s) hrefs are
+        yielded — navigation, anchor and relative links (which outnumber
+        article links on listing pages) never reach Python-level filtering;
+        scrapers whose selection depends on link position must pass False and
+        filter themselves. The element is still attached to its ancestors
+        when yielded, so callers may inspect the parent chain.
+        """
+        for _, el in etree.iterparse(BytesIO(content), events=('end',), tag='a', html=True):
+            href = el.get('href')
+            if href is not None and (not absolute_only or href[:4] == 'http'):
+                yield el, href
+            el.clear()
+            while el.getprevious() is not None:
+                del el.getparent()[0]
+
+    def extract_article_links_from_bytes(self, content: bytes, base_url: str) -> Optional[List[str]]:
+        """
+        Streaming link extraction from raw HTML, for scrapers whose listing
+        selectors don't need the full DOM. Returns None by default, meaning
+        the caller should fall back to parsing and extract_article_links.
+        """
+        return None
+
     @abstractmethod
     def extract_article_links(self, tree: html.HtmlElement, base_url: str) -> List[str]:
         """
@@ -129,66 +276,139 @@ class BaseNewspaperScraper(ABC):
         """
         pass
     
-    def scrape(self) -> Dict[str, Dict[str, str]]:
+    async def _fetch_bytes(self, session: aiohttp.ClientSession, url: str) -> Optional[bytes]:
         """
-        Main scraping method that orchestrates the entire process.
-        
+        Fetch raw page bytes asynchronously.
+
+        Args:
+            session: Shared aiohttp session
+            url: URL to fetch
+
+        Returns:
+            Response body or None if error
+        """
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=self._TIMEOUT)) as response:
+                if response.status == 200:
+                    return await response.read()
+                logger.warning(f"HTTP {response.status} for {url}")
+        except Exception as e:
+            logger.error(f"Error loading {url}: {e}")
+        return None
+
+    async def _parse(self, body: bytes) -> html.HtmlElement:
+        """Parse HTML bytes off the event loop in the scraper's thread pool."""
+        # Parse off the event loop: keeps it responsive and lets parses run
+        # in parallel while other fetches stream in
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._parse_pool,
+            functools.partial(html.fromstring, body, parser=_HTML_PARSER),
+        )
+
+    async def _fetch(self, session: aiohttp.ClientSession, url: str) -> Optional[html.HtmlElement]:
+        """
+        Fetch and parse HTML asynchronously.
+
+        Args:
+            session: Shared aiohttp session
+            url: URL to fetch
+
+        Returns:
+            Parsed HTML tree or None if error
+        """
+        body = await self._fetch_bytes(session, url)
+        if body is None:
+            return None
+        return await self._parse(body)
+
+    async def _scrape_article(self, session: aiohttp.ClientSession,
+                              sem: asyncio.Semaphore, article_url: str):
+        """Fetch and extract a single article, rate-limited by the semaphore."""
+        async with sem:
+            # Politeness delay applies per concurrent worker
+            await asyncio.sleep(self._DELAY)
+            tree_article = await self._fetch(session, article_url)
+
+        if tree_article is None:
+            logger.warning(f"Skipping {article_url} - failed to load")
+            return None
+
+        try:
+            article_data = self.extract_article_data(tree_article, article_url)
+            article_data["newspaper"] = self.name
+            article_data["scraped_at"] = self._now_iso()
+            logger.debug(f"Successfully scraped: {article_data.get('headline', 'N/A')[:50]}")
+            return article_url, article_data
+        except Exception as e:
+            logger.error(f"Error extracting data from {article_url}: {e}")
+            return None
+
+    async def scrape_async(self) -> Dict[str, Dict[str, str]]:
+        """
+        Async scraping method: article pages of each listing are fetched
+        concurrently (bounded per host) instead of one by one.
+
         Returns:
             Dictionary mapping article URLs to their data
         """
         results = {}
-        
+
         logger.info(f"Starting scrape for {self.name}")
-        
-        for page_url in self.urls:
-            logger.info(f"Scraping listing page: {page_url}")
-            
-            # Get listing page
-            tree_main = self.get_tree(page_url)
-            if tree_main is None:
-                logger.warning(f"Skipping {page_url} - failed to load")
-                continue
-            
-            time.sleep(self.request_delay)
-            
-            # Extract article links
-            try:
-                article_links = self.extract_article_links(tree_main, page_url)
-                logger.info(f"Found {len(article_links)} articles on {page_url}")
-            except Exception as e:
-                logger.error(f"Error extracting links from {page_url}: {e}")
-                continue
-            
-            # Scrape each article
-            for article_url in article_links:
-                if article_url in results:
-                    logger.debug(f"Skipping duplicate: {article_url}")
-                    continue
-                
-                logger.debug(f"Scraping article: {article_url}")
-                
-                # Get article page
-                tree_article = self.get_tree(article_url)
-                if tree_article is None:
-                    logger.warning(f"Skipping {article_url} - failed to load")
+
+        sem = asyncio.Semaphore(4)
+        connector = aiohttp.TCPConnector(limit_per_host=4)
+        async with aiohttp.ClientSession(connector=connector, headers=dict(self._HEADERS)) as session:
+            for page_url in self.urls:
+                logger.info(f"Scraping listing page: {page_url}")
+
+                # Get listing page
+                content = await self._fetch_bytes(session, page_url)
+                if content is None:
+                    logger.warning(f"Skipping {page_url} - failed to load")
                     continue
-                
-                time.sleep(self.request_delay)
-                
-                # Extract article data
+
+                # Extract article links: streaming parse where the scraper
+                # supports it, full DOM only as a fallback
                 try:
-                    article_data = self.extract_article_data(tree_article, article_url)
-                    article_data["newspaper"] = self.name
-                    article_data["scraped_at"] = datetime.now().isoformat()
-                    results[article_url] = article_data
-                    logger.debug(f"Successfully scraped: {article_data.get('headline', 'N/A')[:50]}")
+                    article_links = self.extract_article_links_from_bytes(content, page_url)
+                    if article_links is None:
+                        tree_main = await self._parse(content)
+                        article_links = self.extract_article_links(tree_main, page_url)
+                    logger.info(f"Found {len(article_links)} articles on {page_url}")
                 except Exception as e:
-                    logger.error(f"Error extracting data from {article_url}: {e}")
+                    logger.error(f"Error extracting links from {page_url}: {e}")
                     continue
-        
+
+                # Scrape the articles of this listing concurrently.
+                # dict.fromkeys dedupes within the page while keeping order:
+                # a URL repeated on one listing must not spawn two fetches
+                tasks = [
+                    asyncio.create_task(self._scrape_article(session, sem, article_url))
+                    for article_url in dict.fromkeys(article_links)
+                    if article_url not in results and article_url not in self._seen_urls
+                ]
+                for item in await asyncio.gather(*tasks, return_exceptions=True):
+                    if isinstance(item, tuple):
+                        article_url, article_data = item
+                        results.setdefault(article_url, article_data)
+                        self._seen_urls.add(article_url)
+                    elif isinstance(item, Exception):
+                        logger.error(f"Unexpected error scraping article: {item}")
+
         logger.info(f"Completed scrape for {self.name}: {len(results)} articles")
         return results
 
+    def scrape(self) -> Dict[str, Dict[str, str]]:
+        """
+        Main scraping method that orchestrates the entire process.
+        Sync wrapper around scrape_async.
+
+        Returns:
+            Dictionary mapping article URLs to their data
+        """
+        return asyncio.run(self.scrape_async())
+
 
 # ============================================================================
 # Concrete Scraper Implementations
@@ -196,7 +416,26 @@ class BaseNewspaperScraper(ABC):
 
 class LosAndesScraper(BaseNewspaperScraper):
     """Scraper for Los Andes newspaper (preserves original XPath logic)."""
+
+    __slots__ = ()
     
+    # Precompiled XPath expressions: compiled once at class definition so the
+    # query engine skips re-tokenizing the expression on every article.
+    # Cols and hrefs stay separate queries: each card carries image, title
+    # and category links, and only the first href per col is the article URL
+    _XP_COLS = etree.XPath(
+        '/html/body/main/div[1]/div[1]'
+        f'//section[{_xp_class("grouper-simple-news")} and {_xp_class("news-article-wrapper")}]'
+        f'//div[{_xp_class("col")} and {_xp_class("col-lg-4")}]'
+    )
+    _XP_COL_HREF = etree.XPath('.//a/@href')
+    _XP_ARTICLE_ROOT = etree.XPath('/html/body/main/div[2]/div[1]')
+    _XP_HEADLINE = etree.XPath('./header/h1/text()')
+    _XP_SUMMARY = etree.XPath('./div[1]/p//text()')
+    _XP_DATE = etree.XPath('./header/div/span/text()')
+    _XP_AUTHOR = etree.XPath('./div[3]/div[1]/div[1]/div/div[2]/div/div/a/b/text()')
+    _XP_BODY = etree.XPath('./div[3]//article[starts-with(@class, "article-body")]')
+
     def __init__(self):
         super().__init__("Los Andes", SCRAPER_CONFIG["portals"]["Los Andes"])
     
@@ -205,24 +444,14 @@ class LosAndesScraper(BaseNewspaperScraper):
         links = []
         
         try:
-            main_container = tree.xpath('/html/body/main/div[1]/div[1]')
-            if not main_container:
-                return links
-            
-            row_grouper_news = main_container[0].xpath(
-                './/section[contains(@class, "grouper-simple-news") and contains(@class, "news-article-wrapper")]'
-            )
-            
-            for grouper in row_grouper_news:
-                cols_news = grouper.xpath('.//div[contains(@class, "col") and contains(@class, "col-lg-4")]')
-                
-                for col in cols_news:
-                    href_list = col.xpath('.//a/@href')
-                    if href_list:
-                        full_link = href_list[0]
-                        if not full_link.startswith('http'):
-                            full_link = f"https://www.losandes.com.ar{full_link}"
-                        links.append(full_link)
+            for col in self._XP_COLS(tree):
+                hrefs = self._XP_COL_HREF(col)
+                if not hrefs:
+                    continue
+                full_link = hrefs[0]
+                if not full_link.startswith('http'):
+                    full_link = f"https://www.losandes.com.ar{full_link}"
+                links.append(full_link)
         except Exception as e:
             logger.error(f"Error in extract_article_links for Los Andes: {e}")
         
@@ -239,11 +468,11 @@ class LosAndesScraper(BaseNewspaperScraper):
         }
         
         try:
-            article_root = tree.xpath('/html/body/main/div[2]/div[1]')[0]
+            article_root = self._XP_ARTICLE_ROOT(tree)[0]
             
             # Headline
             try:
-                headlines = article_root.xpath('./header/h1/text()')
+                headlines = self._XP_HEADLINE(article_root)
                 if headlines:
                     data["headline"] = headlines[0].strip()
             except Exception as e:
@@ -251,14 +480,14 @@ class LosAndesScraper(BaseNewspaperScraper):
             
             # Summary
             try:
-                topics_date = article_root.xpath('./div[1]/p//text()')
-                data["summary"] = " ".join(topics_date).strip()
+                topics_date = self._XP_SUMMARY(article_root)
+                data["summary"] = _WS.sub(' ', " ".join(topics_date)).strip()
             except Exception as e:
                 logger.debug(f"Error extracting summary: {e}")
             
             # Date
             try:
-                news_date_elements = article_root.xpath('./header/div/span/text()')
+                news_date_elements = self._XP_DATE(article_root)
                 if news_date_elements:
                     data["date"] = news_date_elements[0].strip()
             except Exception as e:
@@ -266,7 +495,7 @@ class LosAndesScraper(BaseNewspaperScraper):
             
             # Author
             try:
-                author_elements = article_root.xpath('./div[3]/div[1]/div[1]/div/div[2]/div/div/a/b/text()')
+                author_elements = self._XP_AUTHOR(article_root)
                 if author_elements:
                     data["author"] = author_elements[0].strip()
             except Exception as e:
@@ -274,11 +503,10 @@ class LosAndesScraper(BaseNewspaperScraper):
             
             # Body
             try:
-                body_divs = article_root.xpath('./div[3]')
-                if body_divs:
-                    body_article_texts = body_divs[0].xpath('.//article[starts-with(@class, "article-body")]//text()')
-                    concatenated_text = " ".join([text.strip() for text in body_article_texts if text.strip()])
-                    data["body"] = concatenated_text.strip()
+                # text_content() walks the subtree once in C, catching text
+                # nested in <a>/<strong> that a text() XPath would drop
+                body_nodes = self._XP_BODY(article_root)
+                data["body"] = _WS.sub(' ', " ".join(node.text_content() for node in body_nodes)).strip()
             except Exception as e:
                 logger.debug(f"Error extracting body: {e}")
         
@@ -290,7 +518,18 @@ class LosAndesScraper(BaseNewspaperScraper):
 
 class DiarioUnoScraper(BaseNewspaperScraper):
     """Scraper for Diario UNO newspaper."""
+
+    __slots__ = ()
     
+    _XP_ARTICLES = etree.XPath('//article')
+    _XP_FIRST_LINK = etree.XPath('.//a/@href')
+    _XP_HEADLINE = etree.XPath(f'//h1[{_xp_class("title")}]/text()')
+    _XP_SUMMARY_H2 = etree.XPath('//h2/text()')
+    _XP_SUMMARY_P = etree.XPath(f'//p[{_xp_class("ignore-parser")}]/text()')
+    _XP_BODY = etree.XPath(f'//div[{_xp_class("article-body")}]//p')
+    _XP_DATE = etree.XPath('//time/text()')
+    _XP_AUTHOR = etree.XPath(f'//span[{_xp_class("author-name")}]/text()')
+
     def __init__(self):
         super().__init__("Diario UNO", SCRAPER_CONFIG["portals"]["Diario UNO"])
     
@@ -300,9 +539,9 @@ class DiarioUnoScraper(BaseNewspaperScraper):
         
         try:
             # Get all article elements and extract the first link from each
-            articles = tree.xpath('//article')
+            articles = self._XP_ARTICLES(tree)
             for article in articles:
-                href_list = article.xpath('.//a/@href')
+                href_list = self._XP_FIRST_LINK(article)
                 if href_list:
                     link = href_list[0]
                     if link.startswith('http'):
@@ -312,6 +551,26 @@ class DiarioUnoScraper(BaseNewspaperScraper):
         
         return links
     
+    def extract_article_links_from_bytes(self, content: bytes, base_url: str) -> Optional[List[str]]:
+        """Stream the first link of each <article> without a full DOM."""
+        links = []
+        # Hold the element proxies themselves: keeping them referenced makes
+        # identity stable, so "first link per <article>" checks stay correct
+        seen_articles = set()
+        # absolute_only=False: a relative first link still claims its
+        # <article> (and gets dropped by the http check), exactly like the
+        # DOM path — otherwise a later category/tag link would take its place
+        for el, href in self._iter_links(content, absolute_only=False):
+            ancestor = el.getparent()
+            while ancestor is not None and ancestor.tag != 'article':
+                ancestor = ancestor.getparent()
+            if ancestor is None or ancestor in seen_articles:
+                continue
+            seen_articles.add(ancestor)
+            if href.startswith('http'):
+                links.append(href)
+        return links
+
     def extract_article_data(self, tree: html.HtmlElement, url: str) -> Dict[str, str]:
         """Extract article data from Diario UNO article page."""
         data = {
@@ -325,7 +584,7 @@ class DiarioUnoScraper(BaseNewspaperScraper):
         try:
             # Headline
             try:
-                headline_elements = tree.xpath('//h1[contains(@class, "title")]/text()')
+                headline_elements = self._XP_HEADLINE(tree)
                 if headline_elements:
                     data["headline"] = headline_elements[0].strip()
             except Exception as e:
@@ -333,9 +592,9 @@ class DiarioUnoScraper(BaseNewspaperScraper):
             
             # Summary (try h2 first, then p.ignore-parser)
             try:
-                summary_elements = tree.xpath('//h2/text()')
+                summary_elements = self._XP_SUMMARY_H2(tree)
                 if not summary_elements:
-                    summary_elements = tree.xpath('//p[contains(@class, "ignore-parser")]/text()')
+                    summary_elements = self._XP_SUMMARY_P(tree)
                 if summary_elements:
                     data["summary"] = summary_elements[0].strip()
             except Exception as e:
@@ -343,14 +602,17 @@ class DiarioUnoScraper(BaseNewspaperScraper):
             
             # Body
             try:
-                body_texts = tree.xpath('//div[contains(@class, "article-body")]//p/text()')
-                data["body"] = " ".join([text.strip() for text in body_texts if text.strip()])
+                # Paragraph-scoped: text_content() per <p> catches text nested
+                # in <strong>/<a> without dragging in inline <script> source or
+                # related-links widgets that live outside the paragraphs
+                body_nodes = self._XP_BODY(tree)
+                data["body"] = _WS.sub(' ', " ".join(node.text_content() for node in body_nodes)).strip()
             except Exception as e:
                 logger.debug(f"Error extracting body: {e}")
             
             # Date
             try:
-                date_elements = tree.xpath('//time/text()')
+                date_elements = self._XP_DATE(tree)
                 if date_elements:
                     data["date"] = date_elements[0].strip()
             except Exception as e:
@@ -358,7 +620,7 @@ class DiarioUnoScraper(BaseNewspaperScraper):
             
             # Author
             try:
-                author_elements = tree.xpath('//span[contains(@class, "author-name")]/text()')
+                author_elements = self._XP_AUTHOR(tree)
                 if author_elements:
                     data["author"] = author_elements[0].strip()
             except Exception as e:
@@ -372,7 +634,17 @@ class DiarioUnoScraper(BaseNewspaperScraper):
 
 class ElSolScraper(BaseNewspaperScraper):
     """Scraper for El Sol newspaper."""
+
+    __slots__ = ()
     
+    _XP_LINKS = etree.XPath('//article//h2/a/@href | //article//h3/a/@href')
+    _XP_HEADLINE = etree.XPath('//h1/text()')
+    _XP_SUMMARY = etree.XPath('//div[@class="newspack-post-subtitle"]/text()')
+    _XP_BODY = etree.XPath(f'//div[{_xp_class("entry-content")}]//p')
+    _XP_DATE_ATTR = etree.XPath('//time/@datetime')
+    _XP_DATE_TEXT = etree.XPath('//time/text()')
+    _XP_AUTHOR = etree.XPath(f'//a[{_xp_class("url")} and {_xp_class("fn")}]/text()')
+
     def __init__(self):
         super().__init__("El Sol", SCRAPER_CONFIG["portals"]["El Sol"])
     
@@ -382,13 +654,27 @@ class ElSolScraper(BaseNewspaperScraper):
         
         try:
             # Extract links from h2 and h3 article titles
-            link_elements = tree.xpath('//article//h2/a/@href | //article//h3/a/@href')
+            link_elements = self._XP_LINKS(tree)
             links = [link for link in link_elements if link.startswith('http')]
         except Exception as e:
             logger.error(f"Error in extract_article_links for El Sol: {e}")
         
         return links
     
+    def extract_article_links_from_bytes(self, content: bytes, base_url: str) -> Optional[List[str]]:
+        """Stream links sitting in article title headings without a full DOM."""
+        links = []
+        for el, href in self._iter_links(content):
+            parent = el.getparent()
+            if parent is None or parent.tag not in ('h2', 'h3'):
+                continue
+            ancestor = parent.getparent()
+            while ancestor is not None and ancestor.tag != 'article':
+                ancestor = ancestor.getparent()
+            if ancestor is not None:
+                links.append(href)
+        return links
+
     def extract_article_data(self, tree: html.HtmlElement, url: str) -> Dict[str, str]:
         """Extract article data from El Sol article page."""
         data = {
@@ -402,7 +688,7 @@ class ElSolScraper(BaseNewspaperScraper):
         try:
             # Headline
             try:
-                headline_elements = tree.xpath('//h1/text()')
+                headline_elements = self._XP_HEADLINE(tree)
                 if headline_elements:
                     data["headline"] = headline_elements[0].strip()
             except Exception as e:
@@ -410,7 +696,7 @@ class ElSolScraper(BaseNewspaperScraper):
             
             # Summary
             try:
-                summary_elements = tree.xpath('//div[@class="newspack-post-subtitle"]/text()')
+                summary_elements = self._XP_SUMMARY(tree)
                 if summary_elements:
                     data["summary"] = summary_elements[0].strip()
             except Exception as e:
@@ -418,20 +704,23 @@ class ElSolScraper(BaseNewspaperScraper):
             
             # Body
             try:
-                body_texts = tree.xpath('//div[contains(@class, "entry-content")]//p/text()')
-                data["body"] = " ".join([text.strip() for text in body_texts if text.strip()])
+                # Paragraph-scoped: text_content() per <p> catches text nested
+                # in <strong>/<a> without dragging in inline <script> source or
+                # related-links widgets that live outside the paragraphs
+                body_nodes = self._XP_BODY(tree)
+                data["body"] = _WS.sub(' ', " ".join(node.text_content() for node in body_nodes)).strip()
             except Exception as e:
                 logger.debug(f"Error extracting body: {e}")
             
             # Date
             try:
                 # Use datetime attribute for more reliable parsing
-                date_elements = tree.xpath('//time/@datetime')
+                date_elements = self._XP_DATE_ATTR(tree)
                 if date_elements:
                     data["date"] = date_elements[0].strip()
                 else:
                     # Fallback to text content
-                    date_elements = tree.xpath('//time/text()')
+                    date_elements = self._XP_DATE_TEXT(tree)
                     if date_elements:
                         data["date"] = date_elements[0].strip()
             except Exception as e:
@@ -439,7 +728,7 @@ class ElSolScraper(BaseNewspaperScraper):
             
             # Author
             try:
-                author_elements = tree.xpath('//a[contains(@class, "url") and contains(@class, "fn")]/text()')
+                author_elements = self._XP_AUTHOR(tree)
                 if author_elements:
                     data["author"] = author_elements[0].strip()
             except Exception as e:
@@ -453,7 +742,17 @@ class ElSolScraper(BaseNewspaperScraper):
 
 class MDZScraper(BaseNewspaperScraper):
     """Scraper for MDZ newspaper."""
+
+    __slots__ = ()
     
+    _XP_LINKS = etree.XPath(f'//a[{_xp_class("news-article__link")}]/@href')
+    _XP_HEADLINE = etree.XPath('//h1/text()')
+    _XP_SUMMARY_TEXTS = etree.XPath(f'//div[{_xp_class("news-detail__lead")}]//text()')
+    _XP_BODY = etree.XPath(f'//div[{_xp_class("news-detail__body")}]//p')
+    _XP_DATE_ATTR = etree.XPath('//time/@datetime')
+    _XP_DATE_TEXT = etree.XPath('//time/text()')
+    _XP_AUTHOR = etree.XPath('//a[contains(@href, "/autor/")]/text()')
+
     def __init__(self):
         super().__init__("MDZ", SCRAPER_CONFIG["portals"]["MDZ"])
     
@@ -463,13 +762,21 @@ class MDZScraper(BaseNewspaperScraper):
         
         try:
             # Extract links with news-article__link class
-            link_elements = tree.xpath('//a[contains(@class, "news-article__link")]/@href')
+            link_elements = self._XP_LINKS(tree)
             links = [link for link in link_elements if link.startswith('http')]
         except Exception as e:
             logger.error(f"Error in extract_article_links for MDZ: {e}")
         
         return links
     
+    def extract_article_links_from_bytes(self, content: bytes, base_url: str) -> Optional[List[str]]:
+        """Stream links carrying the news-article__link class without a full DOM."""
+        links = []
+        for el, href in self._iter_links(content):
+            if 'news-article__link' in el.get('class', '').split():
+                links.append(href)
+        return links
+
     def extract_article_data(self, tree: html.HtmlElement, url: str) -> Dict[str, str]:
         """Extract article data from MDZ article page."""
         data = {
@@ -483,7 +790,7 @@ class MDZScraper(BaseNewspaperScraper):
         try:
             # Headline
             try:
-                headline_elements = tree.xpath('//h1/text()')
+                headline_elements = self._XP_HEADLINE(tree)
                 if headline_elements:
                     data["headline"] = headline_elements[0].strip()
             except Exception as e:
@@ -492,28 +799,31 @@ class MDZScraper(BaseNewspaperScraper):
             # Summary
             try:
                 # Get all text from the lead div, not just paragraphs
-                summary_texts = tree.xpath('//div[contains(@class, "news-detail__lead")]//text()')
+                summary_texts = self._XP_SUMMARY_TEXTS(tree)
                 if summary_texts:
-                    data["summary"] = " ".join([text.strip() for text in summary_texts if text.strip()])
+                    data["summary"] = _WS.sub(' ', " ".join(summary_texts)).strip()
             except Exception as e:
                 logger.debug(f"Error extracting summary: {e}")
             
             # Body
             try:
-                body_texts = tree.xpath('//div[contains(@class, "news-detail__body")]//p//text()')
-                data["body"] = " ".join([text.strip() for text in body_texts if text.strip()])
+                # Paragraph-scoped: text_content() per <p> catches text nested
+                # in <strong>/<a> without dragging in inline <script> source or
+                # related-links widgets that live outside the paragraphs
+                body_nodes = self._XP_BODY(tree)
+                data["body"] = _WS.sub(' ', " ".join(node.text_content() for node in body_nodes)).strip()
             except Exception as e:
                 logger.debug(f"Error extracting body: {e}")
             
             # Date
             try:
                 # Use datetime attribute for more reliable parsing
-                date_elements = tree.xpath('//time/@datetime')
+                date_elements = self._XP_DATE_ATTR(tree)
                 if date_elements:
                     data["date"] = date_elements[0].strip()
                 else:
                     # Fallback to text content
-                    date_elements = tree.xpath('//time/text()')
+                    date_elements = self._XP_DATE_TEXT(tree)
                     if date_elements:
                         data["date"] = date_elements[0].strip()
             except Exception as e:
@@ -521,7 +831,7 @@ class MDZScraper(BaseNewspaperScraper):
             
             # Author
             try:
-                author_elements = tree.xpath('//a[contains(@href, "/autor/")]/text()')
+                author_elements = self._XP_AUTHOR(tree)
                 if author_elements:
                     data["author"] = author_elements[0].strip()
             except Exception as e:
@@ -542,7 +852,11 @@ class NewspaperScraperOrchestrator:
     Orchestrates scraping across multiple newspaper portals.
     Handles duplicate detection, aggregation, and export.
     """
-    
+
+    # Canonical column order for exports and DataFrame conversion
+    COLUMNS = ("url", "newspaper", "headline", "summary", "body", "date", "author", "scraped_at")
+
+
     def __init__(self):
         """Initialize orchestrator with all scrapers."""
         self.scrapers = [
@@ -551,50 +865,94 @@ class NewspaperScraperOrchestrator:
             ElSolScraper(),
             MDZScraper()
         ]
-        self.portal_delay = SCRAPER_CONFIG["portal_delay"]
         self.results = {}
-    
-    def scrape_all(self) -> Dict[str, Dict[str, str]]:
+        # SimHash signatures of accepted bodies, for near-duplicate detection
+        self._body_sigs = []
+
+    def _is_near_duplicate(self, body: str) -> bool:
         """
-        Scrape all configured portals.
-        
+        Check a body against already-accepted articles via SimHash.
+
+        Returns True if the body is within Hamming distance 3 of a known
+        signature (i.e. almost-verbatim wire copy); otherwise records the
+        signature and returns False. Linear scan is fine at the few hundred
+        articles a run produces.
+        """
+        if not body:
+            return False
+        sig = _simhash64(body)
+        for other in self._body_sigs:
+            if (sig ^ other).bit_count() <= 3:
+                return True
+        self._body_sigs.append(sig)
+        return False
+
+    async def scrape_all_async(self) -> Dict[str, Dict[str, str]]:
+        """
+        Scrape all configured portals concurrently.
+
         Returns:
             Dictionary mapping article URLs to their data
         """
         logger.info("=" * 80)
         logger.info("Starting newspaper scraping orchestrator")
         logger.info("=" * 80)
-        
+
         all_results = {}
-        
-        for i, scraper in enumerate(self.scrapers):
-            # Scrape this portal
-            portal_results = scraper.scrape()
-            
-            # Check for duplicates
-            duplicates = 0
-            for url, data in portal_results.items():
-                if url in all_results:
-                    duplicates += 1
-                    logger.warning(f"Duplicate URL detected: {url}")
+
+        # One shared seen-URL set: an article syndicated by two portals is
+        # fetched and parsed only once across the whole run
+        seen_urls: set = set()
+        for scraper in self.scrapers:
+            scraper.set_seen_urls(seen_urls)
+
+        # Portals are disjoint hosts, so they can run in parallel; per-host
+        # politeness is already enforced by each scraper's semaphore
+        portal_results_list = await asyncio.gather(
+            *(scraper.scrape_async() for scraper in self.scrapers)
+        )
+
+        for scraper, portal_results in zip(self.scrapers, portal_results_list):
+            # Exact-URL dedupe in one set difference, then body-level
+            # near-dupe check; counts are logged once per portal instead of
+            # one warning per duplicate article
+            new_urls = portal_results.keys() - all_results.keys()
+            duplicates = len(portal_results) - len(new_urls)
+            near_duplicates = 0
+            for url in new_urls:
+                data = portal_results[url]
+                if self._is_near_duplicate(data.get("body", "")):
+                    near_duplicates += 1
                 else:
                     all_results[url] = data
-            
+
             if duplicates > 0:
                 logger.info(f"Removed {duplicates} duplicate(s) from {scraper.name}")
-            
-            # Delay between portals (except after the last one)
-            if i < len(self.scrapers) - 1:
-                logger.info(f"Waiting {self.portal_delay}s before next portal...")
-                time.sleep(self.portal_delay)
-        
+            if near_duplicates > 0:
+                logger.info(f"Removed {near_duplicates} near-duplicate(s) from {scraper.name}")
+
         self.results = all_results
-        
+        self.close()
+
         logger.info("=" * 80)
         logger.info(f"Scraping complete! Total articles: {len(all_results)}")
         logger.info("=" * 80)
-        
+
         return all_results
+
+    def scrape_all(self) -> Dict[str, Dict[str, str]]:
+        """
+        Scrape all configured portals. Sync wrapper around scrape_all_async.
+
+        Returns:
+            Dictionary mapping article URLs to their data
+        """
+        return asyncio.run(self.scrape_all_async())
+
+    def close(self) -> None:
+        """Close every scraper's pooled HTTP session."""
+        for scraper in self.scrapers:
+            scraper.close()
     
     def to_dataframe(self) -> pd.DataFrame:
         """
@@ -616,8 +974,7 @@ class NewspaperScraperOrchestrator:
         df = pd.DataFrame(df_data)
         
         # Reorder columns for better readability
-        column_order = ["url", "newspaper", "headline", "summary", "body", "date", "author", "scraped_at"]
-        existing_columns = [col for col in column_order if col in df.columns]
+        existing_columns = [col for col in self.COLUMNS if col in df.columns]
         df = df[existing_columns]
         
         return df
@@ -629,13 +986,19 @@ class NewspaperScraperOrchestrator:
         Args:
             filename: Output filename
         """
-        df = self.to_dataframe()
-        if df.empty:
+        if not self.results:
             logger.warning("No data to export")
             return
-        
-        df.to_csv(filename, index=False, encoding='utf-8')
-        logger.info(f"Exported {len(df)} articles to {filename}")
+
+        # Stream rows straight from the results dict: no intermediate
+        # DataFrame (and its type inference) just to write text to disk
+        with open(filename, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(self.COLUMNS)
+            for url, data in self.results.items():
+                writer.writerow([url] + [data.get(col, "") for col in self.COLUMNS[1:]])
+
+        logger.info(f"Exported {len(self.results)} articles to {filename}")
     
     def export_json(self, filename: str = "news_data.json") -> None:
         """
@@ -648,9 +1011,15 @@ class NewspaperScraperOrchestrator:
             logger.warning("No data to export")
             return
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.results, f, ensure_ascii=False, indent=2)
-        
+        if orjson is not None:
+            # orjson serializes to UTF-8 bytes in native code, several times
+            # faster than stdlib json for large dict-of-dicts payloads
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(self.results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(self.results, f, ensure_ascii=False, indent=2)
+
         logger.info(f"Exported {len(self.results)} articles to {filename}")
 
 
@@ -663,9 +1032,15 @@ if __name__ == "__main__":
     orchestrator = NewspaperScraperOrchestrator()
     results = orchestrator.scrape_all()
     
-    # Export to both formats
-    orchestrator.export_csv("news_data.csv")
-    orchestrator.export_json("news_data.json")
+    # Export to both formats in parallel: both only read the finished
+    # results dict, so the disk writes can overlap
+    with ThreadPoolExecutor(max_workers=2) as export_pool:
+        futures = [
+            export_pool.submit(orchestrator.export_csv, "news_data.csv"),
+            export_pool.submit(orchestrator.export_json, "news_data.json"),
+        ]
+        for future in futures:
+            future.result()
     
     # Display summary
     df = orchestrator.to_dataframe()
@@ -1,11 +1,24 @@
 # %pip install lxml
 
+import asyncio
+import random
+import httpx
 import requests
-from lxml import html
-import json
-import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree, html
+import re
+from dataclasses import dataclass
 import pandas as pd
 
+try:
+    import requests_cache
+except ImportError:  # dependencia opcional: sin ella se scrapea sin caché
+    requests_cache = None
+
 headers = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
 }
@@ -19,180 +32,531 @@ newspapers_list = {
 
 json_news_list = {}
 
+# Links ya encolados en esta corrida: una nota que aparece en varias páginas
+# del índice (o en más de un diario) se descarga y parsea una sola vez.
+# Acá también se podría intersecar con los links ya cargados en la capa
+# silver en corridas anteriores (A DESARROLLAR)
+seen_links = set()
+
+# Sesión compartida con pool de conexiones: reutiliza la conexión TCP/TLS
+# hacia cada diario en vez de rehacer el handshake en cada request.
+# Con requests-cache disponible, las páginas de listado que no cambiaron se
+# revalidan con ETag/If-Modified-Since y un 304 evita descargar y re-parsear
+# cientos de KB por corrida
+if requests_cache is not None:
+    SESSION = requests_cache.CachedSession(
+        "scrape_cache.sqlite",
+        backend="sqlite",
+        expire_after=3600,
+        cache_control=True,
+    )
+else:
+    SESSION = requests.Session()
+SESSION.headers.update(headers)
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+# Parser HTML compartido: consume bytes UTF-8 directamente (sin decodificar
+# en Python) y descarta comentarios y espacios en blanco, achicando el DOM
+# que luego recorren los XPath
+HTML_PARSER = html.HTMLParser(encoding='utf-8', remove_blank_text=True, remove_comments=True)
+
+# Corridas de espacios/saltos de línea colapsadas en una sola pasada en C
+_WS = re.compile(r'\s+')
+
 def get_tree(url):
-    """Función auxiliar para obtener el árbol HTML de una URL"""
+    """
+    Función auxiliar para obtener el árbol HTML de una URL (camino sync
+    legado: el pipeline descarga por httpx y parsea los bytes aparte)
+    """
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = SESSION.get(url, timeout=10)
+        # Fijar la codificación evita que requests corra su detección de
+        # charset (milisegundos de CPU puro por página) si algo toca .text
+        response.encoding = 'utf-8'
         if response.status_code == 200:
-            # Explicitly decode content as UTF-8 to handle special characters correctly
-            return html.fromstring(response.content.decode('utf-8'))
+            # El parser compartido ya está configurado en UTF-8 y parsea bytes
+            return html.fromstring(response.content, parser=HTML_PARSER)
     except Exception as e:
         print(f"Error cargando {url}: {e}")
     return None
 
+def fetch_listado(url):
+    """
+    Descarga los bytes de una página de listado vía la sesión cacheada: si la
+    página no cambió desde la corrida anterior, el servidor responde 304 y el
+    cuerpo sale de la caché sqlite sin volver a bajar cientos de KB.
+    """
+    try:
+        response = SESSION.get(url, timeout=10)
+        if response.status_code == 200:
+            return response.content
+        print(f"Error cargando {url}: HTTP {response.status_code}")
+    except Exception as e:
+        print(f"Error cargando {url}: {e}")
+    return None
+
+async def fetch_content(client, url, range_bytes=None):
+    """
+    Función auxiliar asíncrona para obtener los bytes crudos de una URL.
+    Con range_bytes pide solo el prefijo de la página (Range: bytes=0-N):
+    los campos que extraemos viven al principio del HTML y el resto
+    (footer, recomendados) puede ser varias veces más pesado.
+    """
+    try:
+        if range_bytes:
+            response = await client.get(url, headers={"Range": f"bytes=0-{range_bytes}"})
+            # 206: rango aceptado; 200: el servidor ignoró el Range y mandó todo
+            if response.status_code in (200, 206):
+                return response.content
+            # 416: el servidor no soporta rangos para este recurso -> completo
+            if response.status_code != 416:
+                print(f"Error cargando {url}: HTTP {response.status_code}")
+                return None
+
+        response = await client.get(url)
+        if response.status_code == 200:
+            return response.content
+        print(f"Error cargando {url}: HTTP {response.status_code}")
+    except Exception as e:
+        print(f"Error cargando {url}: {e}")
+    return None
+
+async def fetch(client, url, range_bytes=None):
+    """
+    Función auxiliar asíncrona para obtener el árbol HTML de una URL.
+    Ojo con range_bytes: el parser en modo recuperación acepta HTML truncado
+    sin lanzar nada, así que el caller es quien debe validar que el prefijo
+    esté completo (ver is_complete en el parser del diario).
+    """
+    contenido = await fetch_content(client, url, range_bytes=range_bytes)
+    if contenido is None:
+        return None
+    return html.fromstring(contenido, parser=HTML_PARSER)
+
+class LinkTarget:
+    """
+    Parser 'target' de lxml para las páginas de listado: junta los links de
+    las columnas de noticias a medida que el parser C avanza, sin construir
+    el DOM completo de la página (solo necesitamos los <a href>).
+    """
+    def __init__(self):
+        self.links = []
+        self._depth = 0
+        self._section_depth = None
+        self._col_depth = None
+        self._col_con_link = False
+
+    def start(self, tag, attrs):
+        self._depth += 1
+        clases = (attrs.get("class") or "").split()
+        if self._section_depth is None:
+            if tag == "section" and "grouper-simple-news" in clases and "news-article-wrapper" in clases:
+                self._section_depth = self._depth
+            return
+        if self._col_depth is None:
+            if tag == "div" and "col" in clases and "col-lg-4" in clases:
+                self._col_depth = self._depth
+                self._col_con_link = False
+            return
+        # Primer <a href> dentro de cada columna, igual que XP_HREF(col)[0]
+        if tag == "a" and not self._col_con_link:
+            href = attrs.get("href")
+            if href:
+                self.links.append(href)
+                self._col_con_link = True
+
+    def end(self, tag):
+        if self._col_depth == self._depth:
+            self._col_depth = None
+        if self._section_depth == self._depth:
+            self._section_depth = None
+        self._depth -= 1
+
+    def data(self, data):
+        pass
+
+    def comment(self, text):
+        pass
+
+    def close(self):
+        links = self.links
+        self.links = []
+        return links
+
+def extraer_links_listado(contenido):
+    """Extrae los links de un listado con el parser target, sin DOM completo"""
+    parser = etree.HTMLParser(target=LinkTarget())
+    parser.feed(contenido)
+    return parser.close()
+
+# Un semáforo por host: cada diario tolera hasta 5 requests simultáneas,
+# y los distintos diarios no compiten entre sí por un límite global
+host_semaphores = defaultdict(lambda: asyncio.Semaphore(5))
+
+async def fetch_polite(client, url, parse=True, range_bytes=None):
+    """Descarga acotada por host, con una espera aleatoria corta de cortesía"""
+    async with host_semaphores[urlparse(url).netloc]:
+        await asyncio.sleep(random.uniform(0.1, 0.3))
+        if parse:
+            return await fetch(client, url, range_bytes=range_bytes)
+        return await fetch_content(client, url, range_bytes=range_bytes)
+
+async def fetch_listado_polite(url):
+    """Variante de fetch_polite para listados: va por la sesión cacheada
+    (requests, sync) en un hilo, manteniendo el semáforo por host y el jitter"""
+    async with host_semaphores[urlparse(url).netloc]:
+        await asyncio.sleep(random.uniform(0.1, 0.3))
+        return await asyncio.to_thread(fetch_listado, url)
+
+class LosAndesParser:
+    """
+    Parser específico de Los Andes: agrupa sus XPaths compilados y sus reglas
+    de extracción. Nuevos diarios se agregan registrando otro parser en
+    PARSERS, sin tocar el loop principal de scrapping_process.
+    """
+    BASE_URL = "https://www.losandes.com.ar"
+
+    # Prefijo a pedir con Range en las páginas de noticia: los cinco campos
+    # que extraemos aparecen dentro de los primeros 64 KB del HTML
+    RANGE_BYTES = 65535
+
+    # Expresiones XPath compiladas una sola vez al definir la clase: lxml no
+    # vuelve a parsear el string de la expresión en cada noticia
+    XP_ARTICLE_ROOT = etree.XPath('/html/body/main/div[2]/div[1]')
+    XP_HEADLINE = etree.XPath('./header/h1/text()')
+    XP_SUMMARY = etree.XPath('./div[1]/p')
+    XP_DATE = etree.XPath('./header/div/span/text()')
+    XP_AUTHOR = etree.XPath('./div[3]/div[1]/div[1]/div/div[2]/div/div/a/b/text()')
+    XP_ARTICLE_BODY = etree.XPath('./div[3]//article[starts-with(@class, "article-body")]')
+
+    def is_complete(self, contenido):
+        """
+        True si el prefijo pedido con Range ya trae el cuerpo completo de la
+        nota: el parser en modo recuperación parsea HTML truncado sin quejarse,
+        así que el corte hay que detectarlo acá mirando que el <article> del
+        cuerpo abra y cierre dentro de los bytes recibidos.
+        """
+        inicio = contenido.find(b"article-body")
+        return inicio != -1 and contenido.find(b"</article>", inicio) != -1
+
+    def extract_links(self, contenido):
+        """Links absolutos de una página de listado (bytes crudos)"""
+        links = []
+        for link in extraer_links_listado(contenido):
+            if not link.startswith('http'): # Validar si el link es relativo o absoluto
+                link = f"{self.BASE_URL}{link}"
+            links.append(link)
+        return links
+
+    def extract_article(self, tree_article, articulo, link):
+        """Completa en el lugar los campos del registro 'articulo'"""
+        # Los XPath compilados devuelven listas vacías cuando no matchean
+        # (no lanzan excepciones): alcanza con chequeos lineales en vez de
+        # un try/except con print por cada campo
+
+        # Dirigete a full XPATH /html/body/main/div[2]/div[1]
+        roots = self.XP_ARTICLE_ROOT(tree_article)
+        if not roots:
+            print(f"Error cargando 'article_root' de {link}: estructura inesperada")
+            return None
+        article_root = roots[0]
+
+        # Obten el string de /header/h1 -> "new_headline"
+        headlines = self.XP_HEADLINE(article_root)
+        if headlines:
+            articulo.new_headline = headlines[0].strip()
+
+        # Obten el string de /div[1]/p -> "new_summary"
+        summary_nodes = self.XP_SUMMARY(article_root) # text_content() incluye el texto dentro de un <span> o <strong>
+        if summary_nodes:
+            texto = " ".join(nodo.text_content() for nodo in summary_nodes)
+            articulo.new_summary = _WS.sub(" ", texto).strip()
+
+        # Obten el string de /header/div/span -> "new_date"
+        news_date_elements = self.XP_DATE(article_root)
+        if news_date_elements:
+            articulo.new_date = news_date_elements[0].strip()
+
+        # Obten el string de /div[3]/div[1]/div[1]/div/div[2]/div/div/a/b -> "new_author"
+        author_elements = self.XP_AUTHOR(article_root)
+        if author_elements:
+            articulo.new_author = author_elements[0].strip()
+
+        # Dirigete a /div[3] e itera en cada class que inicie con "article_body"
+        # text_content() recorre el subárbol una sola vez en C; el regex
+        # normaliza todos los espacios en una única pasada
+        body_nodes = self.XP_ARTICLE_BODY(article_root)
+        if body_nodes:
+            texto = " ".join(nodo.text_content() for nodo in body_nodes)
+            articulo.new_body = _WS.sub(" ", texto).strip()
+
+# Registro de parsers: un lookup por diario en vez de cadenas de
+# if self.newspaper == "..." chequeadas en cada noticia
+PARSERS = {
+    "Los Andes": LosAndesParser(),
+}
+
+@dataclass(slots=True)
+class Article:
+    """
+    Registro de una noticia. Con slots=True cada instancia ocupa una fracción
+    de lo que pesa un diccionario de 6 claves y el acceso a los campos es por
+    índice de slot en lugar de hashing.
+    """
+    newspaper: str
+    new_headline: str = ""
+    new_summary: str = ""
+    new_body: str = ""
+    new_date: str = ""
+    new_author: str = ""
+
 def create_key_json(news_list, full_link, newspaper):
     """Función auxiliar para crear una clave en el JSON"""
-    news_list[full_link] = {
-        "new_headline": "",
-        "new_summary": "",
-        "new_body": "",
-        "new_date" : "",
-        "new_author": "",
-        "newspaper": f"{newspaper}"
-    }
+    # No pisar un registro existente: las notas destacadas se repiten
+    # entre páginas del índice
+    if full_link not in news_list:
+        news_list[full_link] = Article(newspaper=newspaper)
     return news_list
 
+# Meses en español -> número: los diarios publican fechas como
+# "16 de enero de 2026 - 13:00", que pd.to_datetime no entiende (solo parsea
+# nombres de mes en inglés) y coercionaría a NaT
+_MESES = {
+    "enero": "01", "febrero": "02", "marzo": "03", "abril": "04",
+    "mayo": "05", "junio": "06", "julio": "07", "agosto": "08",
+    "septiembre": "09", "setiembre": "09", "octubre": "10",
+    "noviembre": "11", "diciembre": "12",
+}
+_FECHA_ES = re.compile(r"(\d{1,2})\s+de\s+([a-záéíóúñ]+)\s+de\s+(\d{4})(?:\s*-\s*(\d{1,2}:\d{2}))?", re.IGNORECASE)
+
+def traducir_fecha(texto):
+    """
+    Convierte '16 de enero de 2026 - 13:00' en '16/01/2026 13:00'. Si el texto
+    no tiene esa forma (o el mes no se reconoce) se devuelve sin cambios, para
+    que pd.to_datetime intente interpretarlo tal cual.
+    """
+    if not texto:
+        return texto
+    coincidencia = _FECHA_ES.search(texto)
+    if coincidencia is None:
+        return texto
+    mes = _MESES.get(coincidencia.group(2).lower())
+    if mes is None:
+        return texto
+    hora = coincidencia.group(4) or "00:00"
+    return f"{coincidencia.group(1)}/{mes}/{coincidencia.group(3)} {hora}"
+
 def json_to_dataframe(news_list):
     """Función auxiliar para convertir el JSON a un DataFrame"""
-    # Convertir el diccionario news_list en una lista de diccionarios para el DataFrame
-    df_data = []
-    for link, data in news_list.items():
-        row = {"new_link": link} # La key principal (link) ahora es una columna
-        row.update(data) # Agrega los demás campos (headline, summary, etc.)
-        df_data.append(row)
-
-    # Crear el DataFrame de pandas
-    df_news = pd.DataFrame(df_data)
+    # Construcción columnar (una lista por columna): pandas consume los
+    # arrays ya alineados en lugar de inferir los tipos fila por fila
+    # desde una lista de diccionarios
+    cols = {
+        "new_link": [],       # La key principal (link) ahora es una columna
+        "new_headline": [],
+        "new_summary": [],
+        "new_body": [],
+        "new_date": [],
+        "new_author": [],
+        "newspaper": []
+    }
+    for link, articulo in news_list.items():
+        cols["new_link"].append(link)
+        for campo in ("new_headline", "new_summary", "new_body", "new_date", "new_author", "newspaper"):
+            cols[campo].append(getattr(articulo, campo))
+
+    # Una sola pasada vectorizada sobre la columna de fechas: los consumidores
+    # reciben datetime64 en vez de re-parsear el mismo string N veces
+    # (las fechas que no se puedan interpretar quedan como NaT)
+    cols["new_date"] = pd.to_datetime(
+        [traducir_fecha(fecha) for fecha in cols["new_date"]],
+        errors="coerce", dayfirst=True
+    )
+
+    # Crear el DataFrame de pandas sin copiar los arrays
+    df_news = pd.DataFrame(cols, copy=False)
+
+    # Solo hay ~4 diarios distintos: como categoría ocupa una fracción
+    # de la memoria de una columna de strings repetidos
+    df_news["newspaper"] = df_news["newspaper"].astype("category")
     return df_news
 
 class scrapping_process:
     def __init__(self, newspaper, url_newspaper):
         self.newspaper = newspaper
         self.url_newspaper = url_newspaper
+        self.parser = PARSERS.get(newspaper) # None si el diario no tiene parser registrado
         print(f"scrapping_process instance created for {self.newspaper} ({self.url_newspaper})")
 
-    def news_list_links(self, url, tree_main, news_list):
-        if self.newspaper == "Los Andes":
-            try:
-                main_container = tree_main.xpath('/html/body/main/div[1]/div[1]')
-            except Exception as e:
-                print(f"Error obteniendo XPATH para 'main_container' en {url}: {e}")
-                return None
-
-            try:
-                row_grouper_news = main_container[0].xpath('.//section[contains(@class, "grouper-simple-news") and contains(@class, "news-article-wrapper")]')
-            except Exception as e:
-                print(f"Error obteniendo XPATH para 'row_grouper_news' en {url}: {e}")
-                return None
-
-            for grouper in row_grouper_news:
-                try:
-                    cols_news = grouper.xpath('.//div[contains(@class, "col") and contains(@class, "col-lg-4")]')
-                except Exception as e:
-                    print(f"Error obteniendo XPATH para 'cols_news' en {url}: {e}")
-                    return None
-
-                for col in cols_news:
-                    try:
-                        full_link = col.xpath('.//a/@href')[0]
-                    except Exception as e:
-                        print(f"Error obteniendo XPATH para 'full_link' en {url}: {e}")
-                        return None
-
-                    if not full_link.startswith('http'): # Validar si el link es relativo o absoluto
-                        full_link = f"https://www.losandes.com.ar{full_link}"
-                    news_list = create_key_json(news_list, full_link, self.newspaper) # Inicializar estructura en el JSON
-        else:
+    def news_list_links(self, url, contenido, news_list):
+        if self.parser is None:
             print(f"No se encontró newspaper válido con '{self.newspaper}' ({url}).")
+            return news_list
 
-        return news_list
-
-    def article_data(self, news_list, link, tree_article):
-        if self.newspaper == "Los Andes":
-            # Dirigete a full XPATH /html/body/main/div[2]/div[1]
-            try:
-                article_root = tree_article.xpath('/html/body/main/div[2]/div[1]')[0]
-            except Exception as e:
-                print(f"Error cargando 'article_root' de {link}:\n{e}")
-                return None
+        try:
+            links = self.parser.extract_links(contenido)
+        except Exception as e:
+            print(f"Error extrayendo links del listado en {url}: {e}")
+            return news_list
 
-            # Obten el string de /header/h1 -> "new_headline"
-            try:
-                headlines = article_root.xpath('./header/h1/text()')
-                news_list[link]["new_headline"] = headlines[0].strip()
-            except Exception as e:
-                print(f"Error cargando 'new_headline' de {link}:\n{e}")
+        for full_link in links:
+            news_list = create_key_json(news_list, full_link, self.newspaper) # Inicializar estructura en el JSON
 
-            # Obten el string de /div[1]/p -> "new_summary"
-            try:
-                topics_date = article_root.xpath('./div[1]/p//text()') # Usamos //text() para obtener texto incluso si está dentro de un <span> o <strong>
-                news_list[link]["new_summary"] = " ".join(topics_date).strip()
-            except Exception as e:
-                print(f"Error cargando 'new_summary' de {link}:\n{e}")
+        return news_list
 
-            # Obten el string de /header/div/span -> "new_date"
-            try:
-                news_date_elements = article_root.xpath('./header/div/span/text()')
-                news_list[link]["new_date"] = news_date_elements[0].strip()
-            except Exception as e:
-                print(f"Error cargando 'new_date' de {link}:\n{e}")
+    async def discover(self, queue, news_list):
+        """
+        Productor del pipeline: descarga los listados del diario y encola cada
+        link descubierto para que los workers lo procesen mientras tanto.
+        """
+        # 1. Se ingresa un newspaper: las páginas de listado se descargan todas
+        # en paralelo por la sesión cacheada (los listados que no cambiaron se
+        # revalidan con un 304 y salen de la caché). Solo los bytes: los links
+        # se extraen sin DOM completo
+        contenidos = await asyncio.gather(*[fetch_listado_polite(url) for url in self.url_newspaper])
+
+        for url, contenido in zip(self.url_newspaper, contenidos):
+
+            # 2. Chequeamos que la página haya cargado
+            if contenido is None:
+                print(f"Error cargando {url}: sin respuesta")
+                continue
 
-            # Obten el string de /div[3]/div[1]/div[1]/div/div[2]/div/div/a/b -> "new_author"
+            # 3. Obtenemos los links de las noticias
             try:
-                author_elements = article_root.xpath('./div[3]/div[1]/div[1]/div/div[2]/div/div/a/b/text()')
-                news_list[link]["new_author"] = author_elements[0].strip()
+                news_list = self.news_list_links(url, contenido, news_list)
             except Exception as e:
-                print(f"Error cargando 'new_author' de {link}:\n{e}")
+                print(f"Error ejecutando función 'scrapping_process.news_list_links': {e}")
+                continue
 
-            # Dirigete a /div[3] e itera en cada class que inicie con "article_body"
-            try:
-                body_divs = article_root.xpath('./div[3]')
-                body_article_texts = body_divs[0].xpath('.//article[starts-with(@class, "article-body")]//text()')
-                concatenated_text = " ".join([text.strip() for text in body_article_texts if text.strip()])
-                news_list[link]["new_body"] = concatenated_text.strip()
-            except Exception as e:
-                print(f"Error cargando 'new_body' de {link}:\n{e}")
+        # 4. paso extra: Chequeamos que esos links a noticias no esten cargados ya en la capa silver.
+        # (A DESARROLLAR)
 
-        else:
-            print(f"No se encontró newspaper válido con '{self.newspaper}' ({link}).")
+        # 5. Encolamos solo las noticias no vistas: los workers las van
+        # descargando apenas aparecen, sin esperar a que terminen los listados
+        for link in news_list:
+            if link in seen_links:
+                continue
+            seen_links.add(link)
+            await queue.put((self, link))
 
         return news_list
 
-    def run(self, json_news_list):
-        # 1. Se ingresa un newspaper, y se itera entre los links del json para obtener el acceso a cada noticia
-        for url in self.url_newspaper:
+    async def run(self, json_news_list, session):
+        """Versión autónoma para un solo diario: arma su propia cola y workers"""
+        queue = asyncio.Queue()
+        raw_articles = []
+        workers = [asyncio.create_task(article_worker(session, queue, raw_articles)) for _ in range(5)]
+        news_list = await self.discover(queue, {})
+        await queue.join()
+        for worker in workers:
+            worker.cancel()
 
-            # 2. Obtenemos el HTML de la página
-            try:
-                tree_main = get_tree(url)
-                time.sleep(1)
-            except Exception as e:
-                print(f"Error cargando {url}: {e}")
-                continue
-
-            # 3. Obtenemos los links de las noticias
-            try:
-                news_list = self.news_list_links(url, tree_main, {})
-            except Exception as e:
-                print(f"Error ejecutando función 'scrapping_process.news_list_links': {e}")
-                continue
+        news_list = parse_articles(raw_articles, news_list)
 
-            # 4. paso extra: Chequeamos que esos links a noticias no esten cargados ya en la capa silver.
-            # (A DESARROLLAR)
-
-            # 5. Iteramos sobre las llaves del json 'new_list' para obtener los datos de cada noticia
-            for link, data in news_list.items():
-                try:
-                    tree_article = get_tree(link)
-                    time.sleep(1)
-                except Exception as e:
-                    print(f"Error cargando {link}:\n{e}")
-                    continue
-                try:
-                    news_list = self.article_data(news_list, link, tree_article)
-                except Exception as e:
-                    print(f"Error ejecutando función 'scrapping_process.article_data': {e}")
-                    continue
-
-                json_news_list = {**json_news_list, **news_list}
+        # Una sola actualización en el lugar por diario: evita recopiar el
+        # diccionario acumulado completo en cada noticia
+        json_news_list.update(news_list)
 
         return json_news_list
 
+async def article_worker(session, queue, raw_articles):
+    """
+    Consumidor del pipeline: toma (proceso, link) de la cola, descarga los
+    bytes de la noticia y los acumula en raw_articles. El parseo (que es
+    trabajo de CPU) queda para parse_articles, así los workers solo se
+    ocupan de mantener la red llena mientras los listados siguen llegando.
+    """
+    while True:
+        proceso, link = await queue.get()
+        try:
+            range_bytes = getattr(proceso.parser, "RANGE_BYTES", None)
+            contenido = await fetch_polite(session, link, parse=False, range_bytes=range_bytes)
+            if contenido is not None and range_bytes and not proceso.parser.is_complete(contenido):
+                # El prefijo cortó el cuerpo de la nota (el parser en modo
+                # recuperación no avisaría): repetimos la descarga completa
+                contenido = await fetch_polite(session, link, parse=False)
+            if contenido is None:
+                print(f"Error cargando {link}: sin respuesta")
+            else:
+                raw_articles.append((proceso.newspaper, link, contenido))
+        except Exception as e:
+            print(f"Error descargando {link}: {e}")
+        finally:
+            queue.task_done()
+
+def parse_article(triple):
+    """
+    Etapa de CPU del pipeline: parsea los bytes de una noticia y extrae sus
+    campos. Corre dentro de los procesos del pool, donde el import del módulo
+    ya dejó compiladas las XPath de cada parser de PARSERS.
+    """
+    newspaper, link, contenido = triple
+    parser = PARSERS.get(newspaper)
+    if parser is None:
+        print(f"No se encontró newspaper válido con '{newspaper}' ({link}).")
+        return link, None
+    try:
+        tree_article = html.fromstring(contenido, parser=HTML_PARSER)
+    except etree.ParserError as e:
+        print(f"Error parseando {link}: {e}")
+        return link, None
+    articulo = Article(newspaper=newspaper)
+    try:
+        parser.extract_article(tree_article, articulo, link)
+    except Exception as e:
+        print(f"Error extrayendo datos de {link}: {e}")
+        return link, None
+    return link, articulo
+
+def parse_articles(raw_articles, news_list):
+    """
+    Parsea en paralelo los bytes ya descargados: el parseo de lxml es trabajo
+    de CPU, así que con N cores se procesan N noticias a la vez en lugar de
+    una por una dentro del event loop. El merge al diccionario es serial.
+    """
+    if not raw_articles:
+        return news_list
+    with ProcessPoolExecutor() as pool:
+        for link, articulo in pool.map(parse_article, raw_articles, chunksize=16):
+            if articulo is not None:
+                news_list[link] = articulo
+    return news_list
+
+async def main():
+    """Corre todos los diarios como pipeline productor/consumidor compartido"""
+    json_news_list = {}
+    queue = asyncio.Queue()
+    # HTTP/2 multiplexa decenas de notas del mismo diario sobre una sola
+    # conexión TLS, en lugar de abrir varios sockets keep-alive
+    limits = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+    raw_articles = []
+    # default_encoding fija UTF-8 también en el camino vivo: si algo toca
+    # .text, httpx no corre su detección de charset (los diarios ya declaran
+    # UTF-8 y el HTML_PARSER parsea los bytes con esa codificación)
+    async with httpx.AsyncClient(http2=True, headers=headers, timeout=10, limits=limits, follow_redirects=True, default_encoding="utf-8") as session:
+        workers = [asyncio.create_task(article_worker(session, queue, raw_articles)) for _ in range(20)]
+        resultados = await asyncio.gather(*[
+            scrapping_process(newspaper, url_newspaper).discover(queue, {})
+            for newspaper, url_newspaper in newspapers_list.items()
+        ])
+        await queue.join()
+        for worker in workers:
+            worker.cancel()
+    for resultado in resultados:
+        json_news_list.update(resultado)
+    # Con la red terminada, el parseo de todas las noticias se reparte
+    # entre los cores de la máquina
+    return parse_articles(raw_articles, json_news_list)
+
 if __name__ == "__main__":
-    for newspaper, url_newspaper in newspapers_list.items():
-        scrapping_instance = scrapping_process(newspaper, url_newspaper)
-        json_news_list = scrapping_instance.run(json_news_list)
-        time.sleep(1)
+    json_news_list = asyncio.run(main())
 
     df_news = json_to_dataframe(json_news_list)
     display(df_news)